@@ -6,6 +6,7 @@ from decimal import Decimal, InvalidOperation
 
 import httpx
 from pydantic import BaseModel, Field
+from pydantic_core import from_json
 
 from app.core.metrics import EXTERNAL_API_COUNT, EXTERNAL_API_DURATION
 from app.domain.models import (
@@ -61,8 +62,8 @@ class _OffResponse(BaseModel):
 # Adapter-Implementierung
 # ---------------------------------------------------------------------------
 
-_LIQUID_PNNS_GROUPS = frozenset({"Beverages"})
-_LIQUID_PRODUCT_TYPES = frozenset({"beverages"})
+# Gemeinsame Marker für pnns_groups_1 und product_type, verglichen in Kleinschreibung
+_LIQUID_MARKERS = frozenset({"beverages", "beverage"})
 
 
 def _safe_decimal(value: float | None, default: Decimal = Decimal("0")) -> Decimal:
@@ -98,7 +99,7 @@ class OpenFoodFactsAdapter(ProductSourcePort):
             EXTERNAL_API_COUNT.labels(source="open_food_facts", status="error").inc()
             raise ExternalApiError("open_food_facts", f"Connection error: {e}") from e
 
-        raw = _OffResponse.model_validate(response.json())
+        raw = _OffResponse.model_validate_json(response.content)
 
         if raw.status == 0 or raw.product is None:
             raise ProductNotFoundError(product_id, "open_food_facts")
@@ -124,7 +125,8 @@ class OpenFoodFactsAdapter(ProductSourcePort):
             EXTERNAL_API_COUNT.labels(source="open_food_facts", status="error").inc()
             raise ExternalApiError("open_food_facts", str(e)) from e
 
-        data = response.json()
+        # Rust-Parser aus pydantic-core statt stdlib json (response.json())
+        data = from_json(response.content)
         products = []
         for raw_product in data.get("products", []):
             try:
@@ -177,6 +179,6 @@ class OpenFoodFactsAdapter(ProductSourcePort):
 
     @staticmethod
     def _detect_liquid(raw: _OffProduct) -> bool:
-        return raw.pnns_groups_1 in _LIQUID_PNNS_GROUPS or bool(
-            raw.product_type and raw.product_type.lower() in _LIQUID_PRODUCT_TYPES
-        )
+        pnns_group = (raw.pnns_groups_1 or "").lower()
+        product_type = (raw.product_type or "").lower()
+        return pnns_group in _LIQUID_MARKERS or product_type in _LIQUID_MARKERS
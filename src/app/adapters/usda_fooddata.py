@@ -6,6 +6,7 @@ from decimal import Decimal
 
 import httpx
 from pydantic import BaseModel, Field
+from pydantic_core import from_json
 
 from app.core.metrics import EXTERNAL_API_COUNT, EXTERNAL_API_DURATION
 from app.domain.models import DataSource, GeneralizedProduct, Macronutrients, Micronutrients
@@ -31,6 +32,14 @@ _NUTRIENT_MAP: dict[str, dict[str, set[int] | Decimal]] = {
     "vitamin_d": {"ids": {1110}, "unit_factor": Decimal("1")},  # in µg
 }
 
+# Umkehrabbildung nutrientId -> Schlüssel, einmalig beim Import aufgebaut
+_NUTRIENT_ID_TO_KEY: dict[int, str] = {
+    nid: key
+    for key, meta in _NUTRIENT_MAP.items()
+    if isinstance(meta["ids"], set)
+    for nid in meta["ids"]
+}
+
 _LIQUID_FOOD_CATEGORIES = frozenset({"Beverages", "Soups, Sauces, and Gravies"})
 
 
@@ -84,7 +93,7 @@ class UsdaFoodDataAdapter(ProductSourcePort):
             EXTERNAL_API_COUNT.labels(source="usda_fooddata", status="error").inc()
             raise ExternalApiError("usda_fooddata", f"Connection error: {e}") from e
 
-        raw = _UsdaFoodItem.model_validate(response.json())
+        raw = _UsdaFoodItem.model_validate_json(response.content)
         return self._normalize(raw)
 
     async def search(self, query: str, limit: int = 10) -> list[GeneralizedProduct]:
@@ -99,7 +108,8 @@ class UsdaFoodDataAdapter(ProductSourcePort):
             EXTERNAL_API_COUNT.labels(source="usda_fooddata", status="error").inc()
             raise ExternalApiError("usda_fooddata", str(e)) from e
 
-        data = response.json()
+        # Rust-Parser aus pydantic-core statt stdlib json (response.json())
+        data = from_json(response.content)
         foods = data.get("foods", [])
         if not isinstance(foods, list):
             return []
@@ -152,14 +162,8 @@ class UsdaFoodDataAdapter(ProductSourcePort):
     @staticmethod
     def _extract_nutrients(food_nutrients: list[_UsdaFoodNutrient]) -> dict[str, Decimal]:
         values: dict[str, Decimal] = {}
-        nutrient_id_to_key = {
-            nid: key
-            for key, meta in _NUTRIENT_MAP.items()
-            if isinstance(meta["ids"], set)
-            for nid in meta["ids"]
-        }
         for fn in food_nutrients:
-            key = nutrient_id_to_key.get(fn.nutrient.nutrient_id)
+            key = _NUTRIENT_ID_TO_KEY.get(fn.nutrient.nutrient_id)
             if key and fn.amount is not None:
                 values[key] = Decimal(str(fn.amount))
         return values
@@ -103,7 +103,9 @@ def get_product_cache(
 ) -> ProductCache:
     global _product_cache
     if _product_cache is None:
-        _product_cache = ProductCache(ttl_seconds=settings.cache_ttl_seconds)
+        _product_cache = ProductCache(
+            ttl_seconds=settings.cache_ttl_seconds, max_size=settings.cache_max_size
+        )
     return _product_cache
 
 
@@ -2,8 +2,9 @@
 from datetime import UTC, date, datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Security, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, Security, status
 from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
 from app.api.dependencies import get_export_service, get_log_service
 from app.core.security import get_tenant_id
@@ -24,6 +25,12 @@ TenantDep = Annotated[str, Security(get_tenant_id)]
 ServiceDep = Annotated[LogService, Depends(get_log_service)]
 ExportServiceDep = Annotated[ExportService, Depends(get_export_service)]
 
+# Range endpoints return up to 366 rows; serializing them in a single pass via
+# TypeAdapter.dump_json skips FastAPI's re-validation and jsonable_encoder round-trip.
+# response_model stays on the routes for the OpenAPI schema.
+_NUTRITION_RANGE_ADAPTER = TypeAdapter(list[DailyNutritionSummary])
+_HYDRATION_RANGE_ADAPTER = TypeAdapter(list[DailyHydrationSummary])
+
 
 @router.post("/", response_model=LogEntry, status_code=status.HTTP_201_CREATED)
 async def create_log_entry(
@@ -97,16 +104,19 @@ async def get_nutrition_range(
     service: ServiceDep,
     from_date: date = Query(..., alias="from"),
     to_date: date = Query(..., alias="to"),
-) -> list[DailyNutritionSummary]:
+) -> Response:
     try:
         dr = DateRangeParams(start_date=from_date, end_date=to_date)
     except ValueError as e:
         # Map to 400 as per common practice for range errors, or 422 if strict
         raise HTTPException(status_code=400, detail=str(e))
 
-    return await service.get_nutrition_range(
+    summaries = await service.get_nutrition_range(
         tenant_id=tenant_id, start_date=dr.start_date, end_date=dr.end_date
     )
+    return Response(
+        content=_NUTRITION_RANGE_ADAPTER.dump_json(summaries), media_type="application/json"
+    )
 
 
 @router.get("/export/csv")
@@ -144,12 +154,15 @@ async def get_hydration_range(
     service: ServiceDep,
     from_date: date = Query(..., alias="from"),
     to_date: date = Query(..., alias="to"),
-) -> list[DailyHydrationSummary]:
+) -> Response:
     try:
         dr = DateRangeParams(start_date=from_date, end_date=to_date)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    return await service.get_hydration_range(
+    summaries = await service.get_hydration_range(
         tenant_id=tenant_id, start_date=dr.start_date, end_date=dr.end_date
     )
+    return Response(
+        content=_HYDRATION_RANGE_ADAPTER.dump_json(summaries), media_type="application/json"
+    )
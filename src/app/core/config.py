@@ -29,6 +29,7 @@ class Settings(BaseSettings):
 
     # Caching
     cache_ttl_seconds: int = 3600
+    cache_max_size: int = 10_000
 
     # Webhooks
     webhook_url: str | None = None
@@ -9,6 +9,11 @@ from typing import Self
 
 from pydantic import BaseModel, Field, model_validator
 
+# Quantisierungs-Exponenten und Skalierungsbasis einmalig anlegen statt pro Aufruf
+_HUNDRED = Decimal("100")
+_Q2 = Decimal("0.01")  # Nährwerte: 2 Nachkommastellen
+_Q1 = Decimal("0.1")  # Volumen: 1 Nachkommastelle
+
 # ---------------------------------------------------------------------------
 # Value Objects
 # ---------------------------------------------------------------------------
@@ -104,19 +109,15 @@ class LogEntry(BaseModel):
     @property
     def scaled_macros(self) -> Macronutrients:
         """Berechnet die absoluten Nährwerte basierend auf der tatsächlichen Menge."""
-        factor = self.quantity_g / Decimal("100")
+        factor = self.quantity_g / _HUNDRED
         m = self.product.macronutrients
         return Macronutrients(
-            calories_kcal=(m.calories_kcal * factor).quantize(Decimal("0.01")),
-            protein_g=(m.protein_g * factor).quantize(Decimal("0.01")),
-            carbohydrates_g=(m.carbohydrates_g * factor).quantize(Decimal("0.01")),
-            fat_g=(m.fat_g * factor).quantize(Decimal("0.01")),
-            fiber_g=(
-                (m.fiber_g * factor).quantize(Decimal("0.01")) if m.fiber_g is not None else None
-            ),
-            sugar_g=(
-                (m.sugar_g * factor).quantize(Decimal("0.01")) if m.sugar_g is not None else None
-            ),
+            calories_kcal=(m.calories_kcal * factor).quantize(_Q2),
+            protein_g=(m.protein_g * factor).quantize(_Q2),
+            carbohydrates_g=(m.carbohydrates_g * factor).quantize(_Q2),
+            fat_g=(m.fat_g * factor).quantize(_Q2),
+            fiber_g=(m.fiber_g * factor).quantize(_Q2) if m.fiber_g is not None else None,
+            sugar_g=(m.sugar_g * factor).quantize(_Q2) if m.sugar_g is not None else None,
         )
 
     @property
@@ -124,8 +125,8 @@ class LogEntry(BaseModel):
         """Liefert die konsumierte Flüssigkeit in ml, nur wenn is_liquid=True."""
         if not self.product.is_liquid or self.product.volume_ml_per_100g is None:
             return None
-        factor = self.quantity_g / Decimal("100")
-        return (self.product.volume_ml_per_100g * factor).quantize(Decimal("0.1"))
+        factor = self.quantity_g / _HUNDRED
+        return (self.product.volume_ml_per_100g * factor).quantize(_Q1)
 
 
 # ---------------------------------------------------------------------------
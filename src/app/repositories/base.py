@@ -5,6 +5,8 @@ from datetime import date
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from app.domain.models import LogEntry
 
 
@@ -14,6 +16,11 @@ class AbstractLogRepository(ABC):
         """Saves a new log entry."""
         ...
 
+    @abstractmethod
+    async def save_many(self, entries: Iterable[LogEntry]) -> list[LogEntry]:
+        """Saves several new log entries in one transaction."""
+        ...
+
     @abstractmethod
     async def find_by_id(self, tenant_id: str, entry_id: str) -> LogEntry | None:
         """Finds a log entry by ID and tenant ID."""
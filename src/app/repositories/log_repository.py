@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Iterable
 from datetime import date
 
 from app.domain.models import LogEntry
@@ -18,10 +19,20 @@ class InMemoryLogRepository(AbstractLogRepository):
         # Struktur: {tenant_id: {log_id: LogEntry}}
         self._store: dict[str, dict[str, LogEntry]] = defaultdict(dict)
 
+    def clear(self) -> None:
+        """Entfernt alle Einträge aller Tenants (z.B. zum Zurücksetzen in Tests)."""
+        self._store.clear()
+
     async def save(self, entry: LogEntry) -> LogEntry:
         self._store[entry.tenant_id][entry.id] = entry
         return entry
 
+    async def save_many(self, entries: Iterable[LogEntry]) -> list[LogEntry]:
+        saved = list(entries)
+        for entry in saved:
+            self._store[entry.tenant_id][entry.id] = entry
+        return saved
+
     async def find_by_id(self, tenant_id: str, entry_id: str) -> LogEntry | None:
         return self._store[tenant_id].get(entry_id)
 
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import CursorResult, Date, String, Text, delete, select
+from sqlalchemy import CursorResult, Date, String, Text, delete, event, select
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
@@ -11,7 +11,24 @@ from app.domain.models import LogEntry
 from app.repositories.base import AbstractLogRepository
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Iterable
+
+
+# WAL lets readers proceed while a writer commits; NORMAL is durable enough in WAL mode
+# and avoids an fsync per transaction. In-memory databases ignore journal_mode=WAL.
+_CONNECT_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+)
+
+
+def _apply_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _CONNECT_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
 
 
 class Base(DeclarativeBase):
@@ -33,6 +50,7 @@ class LogEntryORM(Base):
 class SQLiteLogRepository(AbstractLogRepository):
     def __init__(self, database_url: str) -> None:
         self.engine = create_async_engine(database_url)
+        event.listen(self.engine.sync_engine, "connect", _apply_pragmas)
         self.async_session_maker = async_sessionmaker(self.engine, expire_on_commit=False)
 
     async def initialize(self) -> None:
@@ -40,15 +58,23 @@ class SQLiteLogRepository(AbstractLogRepository):
             await conn.run_sync(Base.metadata.create_all)
 
     async def save(self, entry: LogEntry) -> LogEntry:
+        await self.save_many((entry,))
+        return entry
+
+    async def save_many(self, entries: Iterable[LogEntry]) -> list[LogEntry]:
+        saved = list(entries)
+        # Ein BEGIN/COMMIT für alle Einträge statt eines Commits pro Eintrag
         async with self.async_session_maker() as session, session.begin():
-            orm_entry = LogEntryORM(
-                id=entry.id,
-                tenant_id=entry.tenant_id,
-                log_date=entry.log_date,
-                data=entry.model_dump_json(),
+            session.add_all(
+                LogEntryORM(
+                    id=entry.id,
+                    tenant_id=entry.tenant_id,
+                    log_date=entry.log_date,
+                    data=entry.model_dump_json(),
+                )
+                for entry in saved
             )
-            session.add(orm_entry)
-        return entry
+        return saved
 
     async def find_by_id(self, tenant_id: str, entry_id: str) -> LogEntry | None:
         async with self.async_session_maker() as session:
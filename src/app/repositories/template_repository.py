@@ -25,3 +25,7 @@ class TemplateRepository:
             del self._storage[tenant_id][template_id]
             return True
         return False
+
+    def clear(self) -> None:
+        """Entfernt alle Vorlagen aller Tenants (z.B. zum Zurücksetzen in Tests)."""
+        self._storage.clear()
@@ -19,30 +19,33 @@ class BarcodeService:
         adapter_registry: dict[DataSource, ProductSourcePort],
         lookup_order: list[str],
     ) -> None:
-        self._adapter_registry = adapter_registry
-        self._lookup_order = lookup_order
-
-    async def lookup(self, barcode: str) -> GeneralizedProduct:
-        """
-        Sucht nach einem Produkt anhand des Barcodes in den konfigurierten Quellen.
-
-        Raises:
-            ProductNotFoundError: Wenn das Produkt in keiner Quelle gefunden wurde.
-            ExternalApiError: Wenn bei einem Adapter ein Netzwerk- oder API-Fehler
-                auftritt (propagiert).
-        """
-        for source_name in self._lookup_order:
+        # Reihenfolge einmalig auflösen: ungültige oder nicht registrierte Quellen
+        # werden hier verworfen, lookup() iteriert nur noch über fertige Adapter.
+        adapters: list[ProductSourcePort] = []
+        for source_name in lookup_order:
             try:
                 source_enum = DataSource(source_name)
             except ValueError:
                 logger.warning("Invalid source '%s' in BARCODE_LOOKUP_ORDER", source_name)
                 continue
 
-            adapter = self._adapter_registry.get(source_enum)
+            adapter = adapter_registry.get(source_enum)
             if not adapter:
                 logger.warning("No adapter found for source '%s'", source_name)
                 continue
+            adapters.append(adapter)
+        self._adapters: tuple[ProductSourcePort, ...] = tuple(adapters)
 
+    async def lookup(self, barcode: str) -> GeneralizedProduct:
+        """
+        Sucht nach einem Produkt anhand des Barcodes in den konfigurierten Quellen.
+
+        Raises:
+            ProductNotFoundError: Wenn das Produkt in keiner Quelle gefunden wurde.
+            ExternalApiError: Wenn bei einem Adapter ein Netzwerk- oder API-Fehler
+                auftritt (propagiert).
+        """
+        for adapter in self._adapters:
             try:
                 return await adapter.fetch_by_id(barcode)
             except ProductNotFoundError:
@@ -10,57 +10,70 @@ if TYPE_CHECKING:
     from app.domain.models import LogEntry
 
 
+# Anzahl Zeilen pro geliefertem Chunk (~64 KB bei typischen Zeilenlängen): ein
+# writerows()-Aufruf pro Batch statt eines writerow()/yield-Paares pro Eintrag.
+_BATCH_ROWS = 500
+
+_HEADER = (
+    "date",
+    "time",
+    "product_name",
+    "brand",
+    "source",
+    "quantity_g",
+    "calories_kcal",
+    "protein_g",
+    "carbohydrates_g",
+    "fat_g",
+    "fiber_g",
+    "sugar_g",
+    "is_liquid",
+    "volume_ml",
+    "note",
+)
+
+
 class ExportService:
     def generate_csv(self, entries: list[LogEntry]) -> Iterator[str]:
         """
         Generiert CSV-Daten für eine Liste von LogEntries.
-        Gibt einen Iterator zurück, der Zeile für Zeile als String liefert.
+        Der erste Chunk enthält nur den Header, danach folgen die Zeilen in
+        Batches von bis zu ``_BATCH_ROWS`` Einträgen.
         """
         output = io.StringIO()
         writer = csv.writer(output)
 
-        header = [
-            "date",
-            "time",
-            "product_name",
-            "brand",
-            "source",
-            "quantity_g",
-            "calories_kcal",
-            "protein_g",
-            "carbohydrates_g",
-            "fat_g",
-            "fiber_g",
-            "sugar_g",
-            "is_liquid",
-            "volume_ml",
-            "note",
-        ]
-        writer.writerow(header)
+        writer.writerow(_HEADER)
         yield output.getvalue()
         output.seek(0)
         output.truncate(0)
 
-        for entry in entries:
-            macros = entry.scaled_macros
-            row = [
-                str(entry.log_date),
-                entry.consumed_at.strftime("%H:%M:%S"),
-                entry.product.name,
-                entry.product.brand or "",
-                entry.product.source,
-                str(entry.quantity_g),
-                str(macros.calories_kcal),
-                str(macros.protein_g),
-                str(macros.carbohydrates_g),
-                str(macros.fat_g),
-                str(macros.fiber_g) if macros.fiber_g is not None else "",
-                str(macros.sugar_g) if macros.sugar_g is not None else "",
-                "true" if entry.product.is_liquid else "false",
-                str(entry.consumed_volume_ml) if entry.consumed_volume_ml is not None else "",
-                entry.note or "",
-            ]
-            writer.writerow(row)
+        # csv.writer stringifiziert Decimal/date selbst und schreibt None als leeres Feld
+        for start in range(0, len(entries), _BATCH_ROWS):
+            batch = []
+            for entry in entries[start : start + _BATCH_ROWS]:
+                macros = entry.scaled_macros
+                product = entry.product
+                batch.append(
+                    (
+                        entry.log_date,
+                        entry.consumed_at.strftime("%H:%M:%S"),
+                        product.name,
+                        product.brand,
+                        product.source,
+                        entry.quantity_g,
+                        macros.calories_kcal,
+                        macros.protein_g,
+                        macros.carbohydrates_g,
+                        macros.fat_g,
+                        macros.fiber_g,
+                        macros.sugar_g,
+                        "true" if product.is_liquid else "false",
+                        entry.consumed_volume_ml,
+                        entry.note,
+                    )
+                )
+            writer.writerows(batch)
             yield output.getvalue()
             output.seek(0)
             output.truncate(0)
@@ -7,6 +7,10 @@ from app.domain.models import DailyGoals, DailyGoalsProgress, GoalProgress
 from app.repositories.goals_repository import GoalsRepository
 from app.services.log_service import LogService
 
+_ZERO = Decimal("0")
+_HUNDRED = Decimal("100")
+_Q1 = Decimal("0.1")
+
 
 class GoalsService:
     def __init__(self, repository: GoalsRepository, log_service: LogService) -> None:
@@ -30,12 +34,8 @@ class GoalsService:
         def _calc_progress(target: Decimal | None, actual: Decimal) -> GoalProgress | None:
             if target is None:
                 return None
-            remaining = max(Decimal("0"), target - actual)
-            percent = (
-                (actual / target * Decimal("100")).quantize(Decimal("0.1"))
-                if target > 0
-                else Decimal("100")
-            )
+            remaining = max(_ZERO, target - actual)
+            percent = (actual / target * _HUNDRED).quantize(_Q1) if target > 0 else _HUNDRED
             return GoalProgress(
                 target=target,
                 actual=actual,
@@ -9,6 +9,10 @@ from app.core.config import Settings
 
 logger = logging.getLogger(__name__)
 
+# Strong references to in-flight sends. The event loop only keeps weak references to
+# tasks, and NotificationService is built per request, so the set lives at module level.
+_background_tasks: set[asyncio.Task[None]] = set()
+
 
 class NotificationService:
     def __init__(self, http_client: httpx.AsyncClient, settings: Settings) -> None:
@@ -21,7 +25,9 @@ class NotificationService:
             return
 
         # Fire and forget
-        asyncio.create_task(self._perform_send(title, message))
+        task = asyncio.create_task(self._perform_send(title, message))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
 
     async def _perform_send(self, title: str, message: str) -> None:
         """Internal method to perform the actual HTTP call."""
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Callable
 
 from app.core.metrics import CACHE_HITS, CACHE_MISSES
 from app.domain.models import DataSource, GeneralizedProduct
 
+_MISSING: tuple[float, GeneralizedProduct | None] = (0.0, None)
+
 
 class ProductCache:
     """
@@ -12,21 +15,33 @@ class ProductCache:
     Verhindert redundante externe API-Aufrufe.
     """
 
-    def __init__(self, ttl_seconds: int) -> None:
+    def __init__(
+        self,
+        ttl_seconds: int,
+        *,
+        max_size: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         self._ttl = ttl_seconds
-        # Key: (DataSource, product_id), Value: (GeneralizedProduct, timestamp)
-        self._storage: dict[tuple[DataSource, str], tuple[GeneralizedProduct, float]] = {}
+        # None = unbegrenzt; in der App kommt die Grenze aus Settings.cache_max_size
+        self._max_size = max_size
+        # Monotone Uhr: Sprünge der Systemzeit (NTP, manuelles Stellen) verfälschen keine TTLs.
+        self._clock = clock
+        # Key: (DataSource, product_id), Value: (expires_at, GeneralizedProduct).
+        # Einfügereihenfolge = Alter, die ältesten Einträge stehen vorne.
+        self._store: dict[tuple[DataSource, str], tuple[float, GeneralizedProduct]] = {}
 
     def get(self, source: DataSource, product_id: str) -> GeneralizedProduct | None:
         """Holt ein Produkt aus dem Cache, sofern vorhanden und nicht abgelaufen."""
         key = (source, product_id)
-        if key not in self._storage:
+        expires_at, product = self._store.get(key, _MISSING)
+        if product is None:
             CACHE_MISSES.inc()
             return None
 
-        product, timestamp = self._storage[key]
-        if (time.time() - timestamp) > self._ttl:
-            del self._storage[key]
+        # Lazy Expiry: abgelaufene Einträge werden erst beim Zugriff entfernt
+        if expires_at < self._clock():
+            del self._store[key]
             CACHE_MISSES.inc()
             return None
 
@@ -34,5 +49,12 @@ class ProductCache:
         return product
 
     def set(self, source: DataSource, product_id: str, product: GeneralizedProduct) -> None:
-        """Speichert ein Produkt im Cache mit aktuellem Zeitstempel."""
-        self._storage[(source, product_id)] = (product, time.time())
+        """Speichert ein Produkt im Cache mit aktuellem Ablaufzeitpunkt."""
+        key = (source, product_id)
+        # Neu einfügen statt überschreiben, damit der Eintrag ans Ende (jüngste) rückt
+        self._store.pop(key, None)
+        self._store[key] = (self._clock() + self._ttl, product)
+        if self._max_size is not None and len(self._store) > self._max_size:
+            # Feste TTL: expires_at steigt in Einfügereihenfolge, der erste Schlüssel
+            # ist also immer der am frühesten ablaufende Eintrag.
+            del self._store[next(iter(self._store))]
@@ -1,6 +1,4 @@
-# tests/conftest.py
 from collections.abc import Generator
-from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -8,9 +6,10 @@ from fastapi.testclient import TestClient
 import app.api.dependencies as _deps
 from app.core.config import Settings, get_settings
 from app.main import app
+from app.repositories.sqlite_log_repository import LogEntryORM, SQLiteLogRepository
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_settings() -> Settings:
     return Settings(
         api_keys={"test-key-alice": "tenant_alice", "test-key-bob": "tenant_bob"},
@@ -18,22 +17,47 @@ def test_settings() -> Settings:
     )
 
 
+@pytest.fixture(scope="session")
+def _session_client() -> Generator[TestClient, None, None]:
+    # One TestClient (and thus one ASGI lifespan startup/shutdown) for the whole
+    # session; per-test state is reset by the function-scoped `client` fixture.
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def _log_repository(
+    _session_client: TestClient, test_settings: Settings
+) -> Generator[SQLiteLogRepository, None, None]:
+    # One engine and one create_all for the whole session. The engine is bound to
+    # the TestClient's event loop, so everything async runs through its portal.
+    repo = SQLiteLogRepository(database_url=test_settings.database_url)
+    _session_client.portal.call(repo.initialize)
+    yield repo
+    _session_client.portal.call(repo.engine.dispose)
+
+
+async def _truncate_log_entries(repo: SQLiteLogRepository) -> None:
+    async with repo.engine.begin() as conn:
+        await conn.execute(LogEntryORM.__table__.delete())
+
+
 @pytest.fixture
-def client(test_settings: Settings) -> Generator[TestClient, None, None]:
-    # Reset the log-repository singleton so each test starts with an empty
-    # in-memory SQLite database (avoids bleed-over from previous test runs or
-    # other tests that created real entries via the singleton).
-    _deps._repository = None
+def client(
+    _session_client: TestClient, _log_repository: SQLiteLogRepository, test_settings: Settings
+) -> Generator[TestClient, None, None]:
+    # Install the session-wide repository as the singleton; rows written by a
+    # test are deleted on teardown instead of rebuilding the schema per test.
+    _deps._repository = _log_repository
     # Override get_settings via FastAPI's DI override map (the correct approach
     # for FastAPI; plain unittest.mock.patch does not reach Depends() callbacks).
+    # Re-applied per test because tests clear app.dependency_overrides.
     app.dependency_overrides[get_settings] = lambda: test_settings
     try:
-        with patch("app.core.config.get_settings", return_value=test_settings), TestClient(
-            app
-        ) as c:
-            yield c
+        yield _session_client
     finally:
         app.dependency_overrides.pop(get_settings, None)
+        _session_client.portal.call(_truncate_log_entries, _log_repository)
         _deps._repository = None
 
 
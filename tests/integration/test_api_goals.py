@@ -8,6 +8,8 @@ from app.api.dependencies import get_goals_repository
 from app.core.security import get_tenant_id
 from app.main import app
 
+TODAY = date.today().isoformat()
+
 
 @pytest.fixture(autouse=True)
 def clear_goals():
@@ -67,25 +69,23 @@ def test_patch_goals(client: TestClient, alice_tenant):
 
 
 def test_get_progress_empty(client: TestClient, alice_tenant):
-    today = date.today().isoformat()
-    response = client.get(f"/api/v1/goals/progress?date={today}", headers={"X-API-Key": "any"})
+    response = client.get(f"/api/v1/goals/progress?date={TODAY}", headers={"X-API-Key": "any"})
     assert response.status_code == 200
     data = response.json()
-    assert data["log_date"] == today
+    assert data["log_date"] == TODAY
     assert data["calories"] is None
     assert data["water"] is None
 
 
 def test_get_progress_with_goals(client: TestClient, alice_tenant):
-    today = date.today().isoformat()
     # Set goals
     goals = {"calories_kcal": "2000.0", "water_ml": "2000.0"}
     client.put("/api/v1/goals/", headers={"X-API-Key": "any"}, json=goals)
 
-    response = client.get(f"/api/v1/goals/progress?date={today}", headers={"X-API-Key": "any"})
+    response = client.get(f"/api/v1/goals/progress?date={TODAY}", headers={"X-API-Key": "any"})
     assert response.status_code == 200
     data = response.json()
-    assert data["log_date"] == today
+    assert data["log_date"] == TODAY
     assert Decimal(data["calories"]["target"]) == Decimal("2000.0")
     assert Decimal(data["calories"]["actual"]) == Decimal("0.0")
     assert Decimal(data["calories"]["remaining"]) == Decimal("2000.0")
@@ -3,7 +3,10 @@ from unittest.mock import AsyncMock
 import pytest
 from fastapi.testclient import TestClient
 
+from app.api.dependencies import get_adapter_registry
+from app.core.security import get_tenant_id
 from app.domain.models import DataSource, GeneralizedProduct, Macronutrients
+from app.domain.ports import ExternalApiError
 from app.main import app
 
 
@@ -20,21 +23,31 @@ def mock_adapter_registry():
     yield registry
 
 
-def test_search_products_off_success(
-    client: TestClient, alice_headers: dict, mock_adapter_registry: dict
+@pytest.mark.parametrize(
+    ("source", "query", "limit", "expected_id"),
+    [
+        (DataSource.OPEN_FOOD_FACTS, "apple", 10, "123"),
+        (DataSource.USDA_FOODDATA, "banana", 5, "456"),
+    ],
+)
+def test_search_products_success(
+    client: TestClient,
+    alice_headers: dict,
+    mock_adapter_registry: dict,
+    source: DataSource,
+    query: str,
+    limit: int,
+    expected_id: str,
 ):
     # Setup
     mock_product = GeneralizedProduct(
-        id="123",
-        source=DataSource.OPEN_FOOD_FACTS,
+        id=expected_id,
+        source=source,
         name="Test Product",
         macronutrients=Macronutrients(calories_kcal=100, protein_g=10, carbohydrates_g=20, fat_g=5),
     )
-    off_adapter = mock_adapter_registry[DataSource.OPEN_FOOD_FACTS]
-    off_adapter.search.return_value = [mock_product]
-
-    from app.api.dependencies import get_adapter_registry
-    from app.core.security import get_tenant_id
+    adapter = mock_adapter_registry[source]
+    adapter.search.return_value = [mock_product]
 
     app.dependency_overrides[get_tenant_id] = lambda: "tenant_alice"
     app.dependency_overrides[get_adapter_registry] = lambda: mock_adapter_registry
@@ -42,91 +55,76 @@ def test_search_products_off_success(
     try:
         # Execute
         response = client.get(
-            "/api/v1/products/search?q=apple&source=open_food_facts", headers=alice_headers
+            f"/api/v1/products/search?q={query}&source={source.value}&limit={limit}",
+            headers=alice_headers,
         )
 
         # Assert
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 1
-        assert data[0]["id"] == "123"
-        assert data[0]["source"] == "open_food_facts"
-        off_adapter.search.assert_called_once_with(query="apple", limit=10)
+        assert data[0]["id"] == expected_id
+        assert data[0]["source"] == source.value
+        adapter.search.assert_called_once_with(query=query, limit=limit)
     finally:
         app.dependency_overrides.clear()
 
 
-def test_search_products_usda_success(
+def test_search_products_invalid_source(
     client: TestClient, alice_headers: dict, mock_adapter_registry: dict
 ):
-    # Setup
-    mock_product = GeneralizedProduct(
-        id="456",
-        source=DataSource.USDA_FOODDATA,
-        name="USDA Product",
-        macronutrients=Macronutrients(calories_kcal=200, protein_g=5, carbohydrates_g=40, fat_g=2),
-    )
-    usda_adapter = mock_adapter_registry[DataSource.USDA_FOODDATA]
-    usda_adapter.search.return_value = [mock_product]
-
-    from app.api.dependencies import get_adapter_registry
-    from app.core.security import get_tenant_id
-
     app.dependency_overrides[get_tenant_id] = lambda: "tenant_alice"
+    # The request is rejected before any adapter is used, so skip the real adapter wiring
     app.dependency_overrides[get_adapter_registry] = lambda: mock_adapter_registry
-
-    try:
-        # Execute
-        response = client.get(
-            "/api/v1/products/search?q=banana&source=usda_fooddata&limit=5", headers=alice_headers
-        )
-
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 1
-        assert data[0]["id"] == "456"
-        assert data[0]["source"] == "usda_fooddata"
-        usda_adapter.search.assert_called_once_with(query="banana", limit=5)
-    finally:
-        app.dependency_overrides.clear()
-
-
-def test_search_products_invalid_source(client: TestClient, alice_headers: dict):
-    from app.core.security import get_tenant_id
-
-    app.dependency_overrides[get_tenant_id] = lambda: "tenant_alice"
     try:
         response = client.get(
             "/api/v1/products/search?q=apple&source=invalid_source", headers=alice_headers
         )
         assert response.status_code == 400
         assert "Invalid source" in response.json()["detail"]
+        for adapter in mock_adapter_registry.values():
+            adapter.search.assert_not_called()
     finally:
         app.dependency_overrides.clear()
 
 
-def test_search_products_unsupported_source_for_search(
-    client: TestClient, alice_headers: dict, mock_adapter_registry: dict
+@pytest.mark.parametrize(
+    ("source", "side_effect", "status_code", "detail"),
+    [
+        # Adapter raises while talking to the external API
+        (
+            DataSource.OPEN_FOOD_FACTS,
+            ExternalApiError("open_food_facts", "API Down"),
+            502,
+            "External API error",
+        ),
+        # Registry has no adapter for the requested source
+        (DataSource.USDA_FOODDATA, None, 400, "not supported for search"),
+    ],
+)
+def test_search_products_error(
+    client: TestClient,
+    alice_headers: dict,
+    mock_adapter_registry: dict,
+    source: DataSource,
+    side_effect: Exception | None,
+    status_code: int,
+    detail: str,
 ):
-    from app.core.security import get_tenant_id
+    # Registry without USDA adapter
+    off_adapter = mock_adapter_registry[DataSource.OPEN_FOOD_FACTS]
+    off_adapter.search.side_effect = side_effect
+    registry_without_usda = {DataSource.OPEN_FOOD_FACTS: off_adapter}
 
     app.dependency_overrides[get_tenant_id] = lambda: "tenant_alice"
-
-    # Create a registry without USDA adapter
-    registry_without_usda = {
-        DataSource.OPEN_FOOD_FACTS: mock_adapter_registry[DataSource.OPEN_FOOD_FACTS],
-    }
-    from app.api.dependencies import get_adapter_registry
-
     app.dependency_overrides[get_adapter_registry] = lambda: registry_without_usda
 
     try:
         response = client.get(
-            "/api/v1/products/search?q=apple&source=usda_fooddata", headers=alice_headers
+            f"/api/v1/products/search?q=apple&source={source.value}", headers=alice_headers
         )
-        assert response.status_code == 400
-        assert "not supported for search" in response.json()["detail"]
+        assert response.status_code == status_code
+        assert detail in response.json()["detail"]
     finally:
         app.dependency_overrides.clear()
 
@@ -137,33 +135,11 @@ def test_search_products_unauthorized(client: TestClient):
     assert response.status_code == 401
 
 
-def test_search_products_external_api_error(
+def test_search_products_limit_validation(
     client: TestClient, alice_headers: dict, mock_adapter_registry: dict
 ):
-    from app.api.dependencies import get_adapter_registry
-    from app.core.security import get_tenant_id
-    from app.domain.ports import ExternalApiError
-
-    off_adapter = mock_adapter_registry[DataSource.OPEN_FOOD_FACTS]
-    off_adapter.search.side_effect = ExternalApiError("open_food_facts", "API Down")
     app.dependency_overrides[get_tenant_id] = lambda: "tenant_alice"
     app.dependency_overrides[get_adapter_registry] = lambda: mock_adapter_registry
-
-    try:
-        response = client.get(
-            "/api/v1/products/search?q=apple&source=open_food_facts", headers=alice_headers
-        )
-
-        assert response.status_code == 502
-        assert "External API error" in response.json()["detail"]
-    finally:
-        app.dependency_overrides.clear()
-
-
-def test_search_products_limit_validation(client: TestClient, alice_headers: dict):
-    from app.core.security import get_tenant_id
-
-    app.dependency_overrides[get_tenant_id] = lambda: "tenant_alice"
     try:
         # Too small
         response = client.get(
@@ -176,13 +152,12 @@ def test_search_products_limit_validation(client: TestClient, alice_headers: dic
             "/api/v1/products/search?q=apple&source=open_food_facts&limit=21", headers=alice_headers
         )
         assert response.status_code == 422
+        mock_adapter_registry[DataSource.OPEN_FOOD_FACTS].search.assert_not_called()
     finally:
         app.dependency_overrides.clear()
 
 
 def test_create_manual_product_success(client: TestClient, alice_headers: dict):
-    from app.core.security import get_tenant_id
-
     app.dependency_overrides[get_tenant_id] = lambda: "tenant_alice"
 
     payload = {
@@ -228,8 +203,6 @@ def test_create_manual_product_success(client: TestClient, alice_headers: dict):
 
 
 def test_create_manual_liquid_product_validation(client: TestClient, alice_headers: dict):
-    from app.core.security import get_tenant_id
-
     app.dependency_overrides[get_tenant_id] = lambda: "tenant_alice"
 
     payload = {
@@ -265,10 +238,8 @@ def test_barcode_lookup_success(client: TestClient, alice_headers: dict[str, str
     mock_off = AsyncMock()
     mock_off.fetch_by_id.return_value = mock_product
 
-    from app.api.dependencies import get_adapter_registry, get_settings
+    from app.api.dependencies import get_settings
     from app.core.config import Settings
-    from app.core.security import get_tenant_id
-
     # Dependency Overrides
     app.dependency_overrides[get_tenant_id] = lambda: "tenant_alice"
     app.dependency_overrides[get_settings] = lambda: Settings(
@@ -293,10 +264,8 @@ def test_barcode_lookup_not_found(client: TestClient, alice_headers: dict[str, s
 
     mock_off.fetch_by_id.side_effect = ProductNotFoundError("999", "open_food_facts")
 
-    from app.api.dependencies import get_adapter_registry, get_settings
+    from app.api.dependencies import get_settings
     from app.core.config import Settings
-    from app.core.security import get_tenant_id
-
     app.dependency_overrides[get_tenant_id] = lambda: "tenant_alice"
     app.dependency_overrides[get_settings] = lambda: Settings(
         api_keys={"test-key-alice": "tenant_alice"}
@@ -4,14 +4,24 @@ from unittest.mock import AsyncMock
 import pytest
 from fastapi.testclient import TestClient
 
-from app.api.dependencies import get_adapter_registry
-from app.core.config import get_settings
+from app.api.dependencies import get_adapter_registry, get_template_repository
 from app.domain.models import DataSource, GeneralizedProduct, Macronutrients, Micronutrients
 from app.main import app
 
 
-@pytest.fixture
-def mock_adapter_registry():
+@pytest.fixture(autouse=True)
+def clear_templates():
+    # TemplateRepository is a singleton via @lru_cache in dependencies.py and the
+    # TestClient is shared across the session, so reset stored templates per test.
+    get_template_repository().clear()
+    yield
+    get_template_repository().clear()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _module_overrides():
+    # Both tests share the same adapter registry, so register the override once
+    # for the module instead of per test. Only the template-log path hits it.
     mock_adapter = AsyncMock()
     mock_adapter.fetch_by_id.return_value = GeneralizedProduct(
         id="test-product",
@@ -25,26 +35,13 @@ def mock_adapter_registry():
         ),
         micronutrients=Micronutrients(),
     )
-    return {DataSource.MANUAL: mock_adapter}
-
-
-@pytest.fixture
-def override_adapter_registry(mock_adapter_registry):
-    app.dependency_overrides[get_adapter_registry] = lambda: mock_adapter_registry
-    yield
-    app.dependency_overrides.pop(get_adapter_registry)
-
-
-@pytest.fixture
-def override_settings(test_settings):
-    app.dependency_overrides[get_settings] = lambda: test_settings
+    registry = {DataSource.MANUAL: mock_adapter}
+    app.dependency_overrides[get_adapter_registry] = lambda: registry
     yield
-    app.dependency_overrides.pop(get_settings)
+    app.dependency_overrides.pop(get_adapter_registry, None)
 
 
-def test_template_lifecycle(
-    client: TestClient, alice_headers: dict[str, str], override_adapter_registry, override_settings
-):
+def test_template_lifecycle(client: TestClient, alice_headers: dict[str, str]):
     # 1. Create a template
     payload = {
         "name": "Quick Lunch",
@@ -90,7 +87,7 @@ def test_template_lifecycle(
     assert len(response.json()) == 0
 
 
-def test_template_not_found(client: TestClient, alice_headers: dict[str, str], override_settings):
+def test_template_not_found(client: TestClient, alice_headers: dict[str, str]):
     response = client.delete("/api/v1/templates/nonexistent", headers=alice_headers)
     assert response.status_code == 404
 
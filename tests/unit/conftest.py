@@ -0,0 +1,52 @@
+from collections.abc import AsyncGenerator
+from datetime import date
+from decimal import Decimal
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.domain.models import DataSource, GeneralizedProduct, Macronutrients
+
+
+def _build_product(is_liquid: bool) -> GeneralizedProduct:
+    # Hand-crafted valid values, so validation is skipped with model_construct
+    return GeneralizedProduct.model_construct(
+        id="test-123",
+        source=DataSource.OPEN_FOOD_FACTS,
+        name="Test Product",
+        macronutrients=Macronutrients.model_construct(
+            calories_kcal=Decimal("100"),
+            protein_g=Decimal("10"),
+            carbohydrates_g=Decimal("50"),
+            fat_g=Decimal("5"),
+        ),
+        is_liquid=is_liquid,
+        volume_ml_per_100g=Decimal("100") if is_liquid else None,
+    )
+
+
+# GeneralizedProduct is frozen, so one instance per session can be shared safely.
+@pytest.fixture(scope="session")
+def solid_product() -> GeneralizedProduct:
+    return _build_product(is_liquid=False)
+
+
+@pytest.fixture(scope="session")
+def liquid_product() -> GeneralizedProduct:
+    return _build_product(is_liquid=True)
+
+
+@pytest.fixture(scope="session")
+def fixed_date() -> date:
+    # Explicit log date instead of date.today(): the service defaults to the UTC date,
+    # so comparing against the local date.today() flakes around midnight.
+    return date(2025, 6, 15)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def http_client() -> AsyncGenerator[httpx.AsyncClient, None]:
+    # Real client for adapter and notification tests; respx_mock intercepts at the
+    # transport level, so no socket is opened and unmatched requests fail the test.
+    async with httpx.AsyncClient() as client:
+        yield client
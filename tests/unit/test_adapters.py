@@ -1,9 +1,9 @@
 # tests/unit/test_adapters.py
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock
 
 import httpx
 import pytest
+import respx
 
 from app.adapters.manual import ManualProductAdapter
 from app.adapters.open_food_facts import OpenFoodFactsAdapter
@@ -12,6 +12,37 @@ from app.domain.models import DataSource, GeneralizedProduct, Macronutrients
 from app.domain.ports import ExternalApiError, ProductNotFoundError
 from app.repositories.manual_product_repository import ManualProductRepository
 
+# Expected values of the upstream fixtures below, parsed once per module
+_LIQUID_VOLUME_ML = Decimal(100)
+_COLA_KCAL = Decimal("42.0")
+_COLA_CARBS_G = Decimal("10.6")
+_COLA_SODIUM_MG = Decimal(10)
+_MILK_KCAL = Decimal("61.0")
+_MILK_PROTEIN_G = Decimal("3.2")
+_MILK_SODIUM_MG = Decimal("43.0")
+
+_OFF_PRODUCT_URL = "https://world.openfoodfacts.org/api/v0/product/{}.json"
+_OFF_SEARCH_URL = "https://world.openfoodfacts.org/cgi/search.pl"
+_USDA_FOOD_URL = "https://api.nal.usda.gov/fdc/v1/food/{}"
+_USDA_SEARCH_URL = "https://api.nal.usda.gov/fdc/v1/foods/search"
+
+
+# Upstream failures every adapter call must map to ExternalApiError: an HTTP error
+# status (raise_for_status) or a transport-level error (httpx.RequestError).
+_UPSTREAM_FAILURES = pytest.mark.parametrize(
+    ("status_code", "error"),
+    [(500, None), (None, httpx.ConnectError("Connection refused"))],
+    ids=["http_500", "connection_error"],
+)
+
+
+def _fail(route: respx.Route, status_code: int | None, error: Exception | None) -> None:
+    if error is not None:
+        route.mock(side_effect=error)
+    else:
+        route.respond(status_code)
+
+
 _OFF_RESPONSE_BEVERAGE = {
     "status": 1,
     "product": {
@@ -30,102 +61,94 @@ _OFF_RESPONSE_BEVERAGE = {
     },
 }
 
+_OFF_RESPONSE_NOT_FOUND = {"status": 0, "product": None}
+
+# Base product for the liquid-detection cases; each case merges its category fields in
+_OFF_RESPONSE_JUICE = {
+    "status": 1,
+    "product": {
+        "code": "111",
+        "product_name": "Fruit Juice",
+        "nutriments": {
+            "energy-kcal_100g": 50.0,
+            "proteins_100g": 0.5,
+            "carbohydrates_100g": 12.0,
+            "fat_100g": 0.0,
+        },
+    },
+}
 
-@pytest.mark.asyncio
-async def test_off_adapter_normalizes_beverage_correctly():
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = _OFF_RESPONSE_BEVERAGE
-    mock_response.raise_for_status = MagicMock()
 
-    mock_client = AsyncMock(spec=httpx.AsyncClient)
-    mock_client.get.return_value = mock_response
+async def test_off_adapter_normalizes_beverage_correctly(
+    http_client: httpx.AsyncClient, respx_mock: respx.MockRouter
+):
+    respx_mock.get(_OFF_PRODUCT_URL.format("5449000000996")).respond(json=_OFF_RESPONSE_BEVERAGE)
 
-    adapter = OpenFoodFactsAdapter(http_client=mock_client)
+    adapter = OpenFoodFactsAdapter(http_client=http_client)
     product = await adapter.fetch_by_id("5449000000996")
 
     assert product.source == DataSource.OPEN_FOOD_FACTS
     assert product.is_liquid is True
-    assert product.volume_ml_per_100g == Decimal("100")
-    assert product.macronutrients.calories_kcal == Decimal("42.0")
-    assert product.macronutrients.carbohydrates_g == Decimal("10.6")
+    assert product.volume_ml_per_100g == _LIQUID_VOLUME_ML
+    assert product.macronutrients.calories_kcal == _COLA_KCAL
+    assert product.macronutrients.carbohydrates_g == _COLA_CARBS_G
     # Sodium: OFF in Gramm, wir erwarten Milligramm
     assert product.micronutrients is not None
-    assert product.micronutrients.sodium_mg == Decimal("10")  # 0.01g * 1000
+    assert product.micronutrients.sodium_mg == _COLA_SODIUM_MG  # 0.01g * 1000
 
 
-@pytest.mark.asyncio
-async def test_off_adapter_raises_not_found():
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"status": 0, "product": None}
-    mock_response.raise_for_status = MagicMock()
+async def test_off_adapter_raises_not_found(
+    http_client: httpx.AsyncClient, respx_mock: respx.MockRouter
+):
+    respx_mock.get(_OFF_PRODUCT_URL.format("0000000000000")).respond(json=_OFF_RESPONSE_NOT_FOUND)
 
-    mock_client = AsyncMock(spec=httpx.AsyncClient)
-    mock_client.get.return_value = mock_response
-
-    adapter = OpenFoodFactsAdapter(http_client=mock_client)
+    adapter = OpenFoodFactsAdapter(http_client=http_client)
 
     with pytest.raises(ProductNotFoundError):
         await adapter.fetch_by_id("0000000000000")
 
 
-@pytest.mark.asyncio
-async def test_off_adapter_detects_liquid_via_product_type():
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "status": 1,
-        "product": {
-            "code": "111",
-            "product_name": "Fruit Juice",
-            "product_type": "beverages",
-            "nutriments": {
-                "energy-kcal_100g": 50.0,
-                "proteins_100g": 0.5,
-                "carbohydrates_100g": 12.0,
-                "fat_100g": 0.0,
-            },
-        },
-    }
-    mock_response.raise_for_status = MagicMock()
-
-    mock_client = AsyncMock(spec=httpx.AsyncClient)
-    mock_client.get.return_value = mock_response
-
-    adapter = OpenFoodFactsAdapter(http_client=mock_client)
-    product = await adapter.fetch_by_id("111")
-
-    assert product.is_liquid is True
-    assert product.volume_ml_per_100g == Decimal("100")
-
-
-@pytest.mark.asyncio
-async def test_off_adapter_fetch_http_error_raises_external_api_error():
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.status_code = 500
-    mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-        "500 Internal Server Error",
-        request=httpx.Request("GET", "https://world.openfoodfacts.org/api/v0/product/123.json"),
-        response=MagicMock(spec=httpx.Response),
+@pytest.mark.parametrize(
+    ("category_fields", "expected_is_liquid", "expected_volume"),
+    [
+        ({"pnns_groups_1": "Beverages"}, True, _LIQUID_VOLUME_ML),
+        ({"product_type": "beverages"}, True, _LIQUID_VOLUME_ML),
+        ({"product_type": "Beverage"}, True, _LIQUID_VOLUME_ML),
+        ({"pnns_groups_1": "Fruits and vegetables"}, False, None),
+    ],
+    ids=["pnns_group", "product_type", "product_type_singular", "solid"],
+)
+async def test_off_adapter_detects_liquid(
+    http_client: httpx.AsyncClient,
+    respx_mock: respx.MockRouter,
+    category_fields: dict[str, str],
+    expected_is_liquid: bool,
+    expected_volume: Decimal | None,
+):
+    respx_mock.get(_OFF_PRODUCT_URL.format("111")).respond(
+        json={
+            **_OFF_RESPONSE_JUICE,
+            "product": {**_OFF_RESPONSE_JUICE["product"], **category_fields},
+        }
     )
 
-    mock_client = AsyncMock(spec=httpx.AsyncClient)
-    mock_client.get.return_value = mock_response
-
-    adapter = OpenFoodFactsAdapter(http_client=mock_client)
+    adapter = OpenFoodFactsAdapter(http_client=http_client)
+    product = await adapter.fetch_by_id("111")
 
-    with pytest.raises(ExternalApiError) as exc_info:
-        await adapter.fetch_by_id("123")
-    assert exc_info.value.source == "open_food_facts"
+    assert product.is_liquid is expected_is_liquid
+    assert product.volume_ml_per_100g == expected_volume
 
 
-@pytest.mark.asyncio
-async def test_off_adapter_fetch_request_error_raises_external_api_error():
-    mock_client = AsyncMock(spec=httpx.AsyncClient)
-    mock_client.get.side_effect = httpx.RequestError("Connection refused")
+@_UPSTREAM_FAILURES
+async def test_off_adapter_fetch_failure_raises_external_api_error(
+    http_client: httpx.AsyncClient,
+    respx_mock: respx.MockRouter,
+    status_code: int | None,
+    error: Exception | None,
+):
+    _fail(respx_mock.get(_OFF_PRODUCT_URL.format("123")), status_code, error)
 
-    adapter = OpenFoodFactsAdapter(http_client=mock_client)
+    adapter = OpenFoodFactsAdapter(http_client=http_client)
 
     with pytest.raises(ExternalApiError) as exc_info:
         await adapter.fetch_by_id("123")
@@ -150,19 +173,15 @@ _OFF_SEARCH_RESPONSE = {
 }
 
 
-@pytest.mark.asyncio
-async def test_off_adapter_search_returns_products():
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = _OFF_SEARCH_RESPONSE
-    mock_response.raise_for_status = MagicMock()
+async def test_off_adapter_search_returns_products(
+    http_client: httpx.AsyncClient, respx_mock: respx.MockRouter
+):
+    route = respx_mock.get(_OFF_SEARCH_URL).respond(json=_OFF_SEARCH_RESPONSE)
 
-    mock_client = AsyncMock(spec=httpx.AsyncClient)
-    mock_client.get.return_value = mock_response
-
-    adapter = OpenFoodFactsAdapter(http_client=mock_client)
+    adapter = OpenFoodFactsAdapter(http_client=http_client)
     results = await adapter.search("apple", limit=5)
 
+    assert route.calls.last.request.url.params["page_size"] == "5"
     assert len(results) == 1
     assert results[0].id == "9999"
     assert results[0].source == DataSource.OPEN_FOOD_FACTS
@@ -170,15 +189,20 @@ async def test_off_adapter_search_returns_products():
     assert results[0].is_liquid is False
 
 
-@pytest.mark.asyncio
-async def test_off_adapter_search_raises_external_api_error():
-    mock_client = AsyncMock(spec=httpx.AsyncClient)
-    mock_client.get.side_effect = httpx.RequestError("Timeout")
+@_UPSTREAM_FAILURES
+async def test_off_adapter_search_failure_raises_external_api_error(
+    http_client: httpx.AsyncClient,
+    respx_mock: respx.MockRouter,
+    status_code: int | None,
+    error: Exception | None,
+):
+    _fail(respx_mock.get(_OFF_SEARCH_URL), status_code, error)
 
-    adapter = OpenFoodFactsAdapter(http_client=mock_client)
+    adapter = OpenFoodFactsAdapter(http_client=http_client)
 
-    with pytest.raises(ExternalApiError):
+    with pytest.raises(ExternalApiError) as exc_info:
         await adapter.search("apple")
+    assert exc_info.value.source == "open_food_facts"
 
 
 # ---------------------------------------------------------------------------
@@ -200,100 +224,89 @@ _USDA_FETCH_RESPONSE = {
 }
 
 
-@pytest.mark.asyncio
-async def test_usda_adapter_fetch_by_id_success():
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = _USDA_FETCH_RESPONSE
-    mock_response.raise_for_status = MagicMock()
-
-    mock_client = AsyncMock(spec=httpx.AsyncClient)
-    mock_client.get.return_value = mock_response
+async def test_usda_adapter_fetch_by_id_success(
+    http_client: httpx.AsyncClient, respx_mock: respx.MockRouter
+):
+    route = respx_mock.get(_USDA_FOOD_URL.format("1104647")).respond(json=_USDA_FETCH_RESPONSE)
 
-    adapter = UsdaFoodDataAdapter(http_client=mock_client, api_key="DEMO_KEY")
+    adapter = UsdaFoodDataAdapter(http_client=http_client, api_key="DEMO_KEY")
     product = await adapter.fetch_by_id("1104647")
 
+    assert route.calls.last.request.url.params["api_key"] == "DEMO_KEY"
     assert product.id == "1104647"
     assert product.source == DataSource.USDA_FOODDATA
     assert product.name == "WHOLE MILK"
     assert product.brand == "DAIRY BRAND"
-    assert product.macronutrients.calories_kcal == Decimal("61.0")
-    assert product.macronutrients.protein_g == Decimal("3.2")
+    assert product.macronutrients.calories_kcal == _MILK_KCAL
+    assert product.macronutrients.protein_g == _MILK_PROTEIN_G
     assert product.is_liquid is False
     assert product.micronutrients is not None
-    assert product.micronutrients.sodium_mg == Decimal("43.0")
-
+    assert product.micronutrients.sodium_mg == _MILK_SODIUM_MG
 
-@pytest.mark.asyncio
-async def test_usda_adapter_fetch_beverage_is_liquid():
-    liquid_response = dict(_USDA_FETCH_RESPONSE)
-    liquid_response["foodCategory"] = "Beverages"
 
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = liquid_response
-    mock_response.raise_for_status = MagicMock()
-
-    mock_client = AsyncMock(spec=httpx.AsyncClient)
-    mock_client.get.return_value = mock_response
+@pytest.mark.parametrize(
+    ("food_category", "expected_is_liquid", "expected_volume"),
+    [
+        ("Beverages", True, _LIQUID_VOLUME_ML),
+        ("Soups, Sauces, and Gravies", True, _LIQUID_VOLUME_ML),
+        ("Dairy and Egg Products", False, None),
+    ],
+)
+async def test_usda_adapter_detects_liquid(
+    http_client: httpx.AsyncClient,
+    respx_mock: respx.MockRouter,
+    food_category: str,
+    expected_is_liquid: bool,
+    expected_volume: Decimal | None,
+):
+    respx_mock.get(_USDA_FOOD_URL.format("1104647")).respond(
+        json={**_USDA_FETCH_RESPONSE, "foodCategory": food_category}
+    )
 
-    adapter = UsdaFoodDataAdapter(http_client=mock_client, api_key="DEMO_KEY")
+    adapter = UsdaFoodDataAdapter(http_client=http_client, api_key="DEMO_KEY")
     product = await adapter.fetch_by_id("1104647")
 
-    assert product.is_liquid is True
-    assert product.volume_ml_per_100g == Decimal("100")
-
+    assert product.is_liquid is expected_is_liquid
+    assert product.volume_ml_per_100g == expected_volume
 
-@pytest.mark.asyncio
-async def test_usda_adapter_fetch_not_found():
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.status_code = 404
-    mock_response.raise_for_status = MagicMock()
 
-    mock_client = AsyncMock(spec=httpx.AsyncClient)
-    mock_client.get.return_value = mock_response
+async def test_usda_adapter_fetch_not_found(
+    http_client: httpx.AsyncClient, respx_mock: respx.MockRouter
+):
+    respx_mock.get(_USDA_FOOD_URL.format("9999999")).respond(404)
 
-    adapter = UsdaFoodDataAdapter(http_client=mock_client, api_key="DEMO_KEY")
+    adapter = UsdaFoodDataAdapter(http_client=http_client, api_key="DEMO_KEY")
 
     with pytest.raises(ProductNotFoundError) as exc_info:
         await adapter.fetch_by_id("9999999")
     assert exc_info.value.source == "usda_fooddata"
 
 
-@pytest.mark.asyncio
-async def test_usda_adapter_fetch_http_error_raises_external_api_error():
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.status_code = 500
-    mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-        "500 Server Error",
-        request=httpx.Request("GET", "https://api.nal.usda.gov/fdc/v1/food/123"),
-        response=MagicMock(spec=httpx.Response),
-    )
-
-    mock_client = AsyncMock(spec=httpx.AsyncClient)
-    mock_client.get.return_value = mock_response
+@_UPSTREAM_FAILURES
+async def test_usda_adapter_fetch_failure_raises_external_api_error(
+    http_client: httpx.AsyncClient,
+    respx_mock: respx.MockRouter,
+    status_code: int | None,
+    error: Exception | None,
+):
+    _fail(respx_mock.get(_USDA_FOOD_URL.format("123")), status_code, error)
 
-    adapter = UsdaFoodDataAdapter(http_client=mock_client, api_key="DEMO_KEY")
+    adapter = UsdaFoodDataAdapter(http_client=http_client, api_key="DEMO_KEY")
 
     with pytest.raises(ExternalApiError) as exc_info:
         await adapter.fetch_by_id("123")
     assert exc_info.value.source == "usda_fooddata"
 
 
-@pytest.mark.asyncio
-async def test_usda_adapter_search_returns_products():
-    mock_response = MagicMock(spec=httpx.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
-        "foods": [_USDA_FETCH_RESPONSE],
-        "totalHits": 1,
-    }
-    mock_response.raise_for_status = MagicMock()
+_USDA_SEARCH_RESPONSE = {"foods": [_USDA_FETCH_RESPONSE], "totalHits": 1}
 
-    mock_client = AsyncMock(spec=httpx.AsyncClient)
-    mock_client.get.return_value = mock_response
 
-    adapter = UsdaFoodDataAdapter(http_client=mock_client, api_key="DEMO_KEY")
+async def test_usda_adapter_search_returns_products(
+    http_client: httpx.AsyncClient, respx_mock: respx.MockRouter
+):
+    respx_mock.get(_USDA_SEARCH_URL).respond(json=_USDA_SEARCH_RESPONSE)
+
+    adapter = UsdaFoodDataAdapter(http_client=http_client, api_key="DEMO_KEY")
     results = await adapter.search("milk", limit=5)
 
     assert len(results) == 1
@@ -301,15 +314,20 @@ async def test_usda_adapter_search_returns_products():
     assert results[0].name == "WHOLE MILK"
 
 
-@pytest.mark.asyncio
-async def test_usda_adapter_search_raises_external_api_error():
-    mock_client = AsyncMock(spec=httpx.AsyncClient)
-    mock_client.get.side_effect = httpx.RequestError("Connection error")
+@_UPSTREAM_FAILURES
+async def test_usda_adapter_search_failure_raises_external_api_error(
+    http_client: httpx.AsyncClient,
+    respx_mock: respx.MockRouter,
+    status_code: int | None,
+    error: Exception | None,
+):
+    _fail(respx_mock.get(_USDA_SEARCH_URL), status_code, error)
 
-    adapter = UsdaFoodDataAdapter(http_client=mock_client, api_key="DEMO_KEY")
+    adapter = UsdaFoodDataAdapter(http_client=http_client, api_key="DEMO_KEY")
 
-    with pytest.raises(ExternalApiError):
+    with pytest.raises(ExternalApiError) as exc_info:
         await adapter.search("milk")
+    assert exc_info.value.source == "usda_fooddata"
 
 
 # ---------------------------------------------------------------------------
@@ -332,34 +350,11 @@ def _make_manual_product(product_id: str = "manual-1") -> GeneralizedProduct:
     )
 
 
-@pytest.mark.asyncio
-async def test_manual_adapter_fetch_by_id_found():
-    repo = ManualProductRepository()
-    product = _make_manual_product("manual-1")
-    repo.save(product)
-
-    adapter = ManualProductAdapter(repository=repo)
-    found = await adapter.fetch_by_id("manual-1")
-
-    assert found.id == "manual-1"
-    assert found.name == "Homemade Granola"
-    assert found.source == DataSource.MANUAL
-
-
-@pytest.mark.asyncio
-async def test_manual_adapter_fetch_by_id_not_found():
-    repo = ManualProductRepository()
-    adapter = ManualProductAdapter(repository=repo)
-
-    with pytest.raises(ProductNotFoundError) as exc_info:
-        await adapter.fetch_by_id("does-not-exist")
-    assert exc_info.value.source == DataSource.MANUAL
-
-
-@pytest.mark.asyncio
-async def test_manual_adapter_search_returns_matching_products():
+@pytest.fixture(scope="module")
+def seeded_repo() -> ManualProductRepository:
+    # Read-only for the tests below, so the products are validated once per module.
     repo = ManualProductRepository()
-    repo.save(_make_manual_product("m-1"))
+    repo.save(_make_manual_product("m-1"))  # brand="My Kitchen"
     repo.save(
         GeneralizedProduct(
             id="m-2",
@@ -373,20 +368,43 @@ async def test_manual_adapter_search_returns_matching_products():
             ),
         )
     )
+    return repo
+
+
+@pytest.fixture(scope="module")
+def empty_repo() -> ManualProductRepository:
+    return ManualProductRepository()
+
+
+async def test_manual_adapter_fetch_by_id_found(seeded_repo: ManualProductRepository):
+    adapter = ManualProductAdapter(repository=seeded_repo)
+    found = await adapter.fetch_by_id("m-1")
+
+    assert found.id == "m-1"
+    assert found.name == "Homemade Granola"
+    assert found.source == DataSource.MANUAL
 
-    adapter = ManualProductAdapter(repository=repo)
+
+async def test_manual_adapter_fetch_by_id_not_found(empty_repo: ManualProductRepository):
+    adapter = ManualProductAdapter(repository=empty_repo)
+
+    with pytest.raises(ProductNotFoundError) as exc_info:
+        await adapter.fetch_by_id("does-not-exist")
+    assert exc_info.value.source == DataSource.MANUAL
+
+
+async def test_manual_adapter_search_returns_matching_products(
+    seeded_repo: ManualProductRepository,
+):
+    adapter = ManualProductAdapter(repository=seeded_repo)
     results = await adapter.search("granola")
 
     assert len(results) == 1
     assert results[0].id == "m-1"
 
 
-@pytest.mark.asyncio
-async def test_manual_adapter_search_matches_brand():
-    repo = ManualProductRepository()
-    repo.save(_make_manual_product("m-1"))  # brand="My Kitchen"
-
-    adapter = ManualProductAdapter(repository=repo)
+async def test_manual_adapter_search_matches_brand(seeded_repo: ManualProductRepository):
+    adapter = ManualProductAdapter(repository=seeded_repo)
     results = await adapter.search("my kitchen")
 
     assert len(results) == 1
@@ -51,7 +51,6 @@ def barcode_service(adapter_registry: dict[DataSource, ProductSourcePort]) -> Ba
     )
 
 
-@pytest.mark.asyncio
 async def test_found_in_first_adapter(
     barcode_service: BarcodeService,
     off_adapter: AsyncMock,
@@ -68,7 +67,6 @@ async def test_found_in_first_adapter(
     usda_adapter.fetch_by_id.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_fallback_to_second_adapter(
     barcode_service: BarcodeService,
     off_adapter: AsyncMock,
@@ -89,7 +87,6 @@ async def test_fallback_to_second_adapter(
     usda_adapter.fetch_by_id.assert_called_once_with("123456")
 
 
-@pytest.mark.asyncio
 async def test_not_found_anywhere(
     barcode_service: BarcodeService,
     off_adapter: AsyncMock,
@@ -107,7 +104,6 @@ async def test_not_found_anywhere(
     assert usda_adapter.fetch_by_id.called
 
 
-@pytest.mark.asyncio
 async def test_external_api_error_propagates(
     barcode_service: BarcodeService,
     off_adapter: AsyncMock,
@@ -123,7 +119,6 @@ async def test_external_api_error_propagates(
     usda_adapter.fetch_by_id.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_invalid_source_in_config_skipped(
     off_adapter: AsyncMock,
     adapter_registry: dict[DataSource, ProductSourcePort],
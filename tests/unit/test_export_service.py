@@ -2,6 +2,8 @@
 from datetime import UTC, date, datetime
 from decimal import Decimal
 
+import pytest
+
 from app.domain.models import (
     DataSource,
     GeneralizedProduct,
@@ -9,7 +11,7 @@ from app.domain.models import (
     Macronutrients,
     Micronutrients,
 )
-from app.services.export_service import ExportService
+from app.services.export_service import _BATCH_ROWS, ExportService
 
 
 def test_generate_csv_header() -> None:
@@ -26,120 +28,140 @@ def test_generate_csv_header() -> None:
     assert header == expected_header
 
 
-def test_generate_csv_with_data() -> None:
-    service = ExportService()
+# (entry, expected_row) pairs built once at import instead of per test.
 
-    product = GeneralizedProduct(
-        id="test-1",
-        source=DataSource.MANUAL,
-        name="Test Product",
-        brand="Test Brand",
-        macronutrients=Macronutrients(
-            calories_kcal=Decimal("100"),
-            protein_g=Decimal("10"),
-            carbohydrates_g=Decimal("20"),
-            fat_g=Decimal("5"),
-            fiber_g=Decimal("2"),
-            sugar_g=Decimal("10"),
-        ),
-        micronutrients=Micronutrients(),
-        is_liquid=False,
-    )
-
-    entry = LogEntry(
+# 200g of 100kcal/100g -> 200kcal
+# protein 10 -> 20
+# carbs 20 -> 40
+# fat 5 -> 10
+# fiber 2 -> 4
+# sugar 10 -> 20
+_CASE_DATA = (
+    LogEntry(
         tenant_id="alice",
         log_date=date(2024, 5, 20),
         consumed_at=datetime(2024, 5, 20, 12, 0, 0, tzinfo=UTC),
-        product=product,
+        product=GeneralizedProduct(
+            id="test-1",
+            source=DataSource.MANUAL,
+            name="Test Product",
+            brand="Test Brand",
+            macronutrients=Macronutrients(
+                calories_kcal=Decimal("100"),
+                protein_g=Decimal("10"),
+                carbohydrates_g=Decimal("20"),
+                fat_g=Decimal("5"),
+                fiber_g=Decimal("2"),
+                sugar_g=Decimal("10"),
+            ),
+            micronutrients=Micronutrients(),
+            is_liquid=False,
+        ),
         quantity_g=Decimal("200"),
         note="Lunch",
-    )
-
-    csv_gen = service.generate_csv([entry])
-    next(csv_gen)  # Skip header
-    row = next(csv_gen)
-
-    # 200g of 100kcal/100g -> 200kcal
-    # protein 10 -> 20
-    # carbs 20 -> 40
-    # fat 5 -> 10
-    # fiber 2 -> 4
-    # sugar 10 -> 20
-
-    expected_row = (
-        "2024-05-20,12:00:00,Test Product,Test Brand,manual,200,"
-        "200.00,20.00,40.00,10.00,4.00,20.00,false,,Lunch\r\n"
-    )
-    assert row == expected_row
-
-
-def test_generate_csv_liquid() -> None:
-    service = ExportService()
+    ),
+    "2024-05-20,12:00:00,Test Product,Test Brand,manual,200,"
+    "200.00,20.00,40.00,10.00,4.00,20.00,false,,Lunch\r\n",
+)
 
-    product = GeneralizedProduct(
-        id="test-liquid",
-        source=DataSource.MANUAL,
-        name="Water",
-        brand=None,
-        macronutrients=Macronutrients(
-            calories_kcal=Decimal("0"),
-            protein_g=Decimal("0"),
-            carbohydrates_g=Decimal("0"),
-            fat_g=Decimal("0"),
+# 250g liquid with 100ml/100g -> 250ml
+_CASE_LIQUID = (
+    LogEntry(
+        tenant_id="alice",
+        log_date=date(2024, 5, 20),
+        consumed_at=datetime(2024, 5, 20, 10, 0, 0, tzinfo=UTC),
+        product=GeneralizedProduct(
+            id="test-liquid",
+            source=DataSource.MANUAL,
+            name="Water",
+            brand=None,
+            macronutrients=Macronutrients(
+                calories_kcal=Decimal("0"),
+                protein_g=Decimal("0"),
+                carbohydrates_g=Decimal("0"),
+                fat_g=Decimal("0"),
+            ),
+            is_liquid=True,
+            volume_ml_per_100g=Decimal("100"),
         ),
-        is_liquid=True,
-        volume_ml_per_100g=Decimal("100"),
-    )
+        quantity_g=Decimal("250"),
+    ),
+    "2024-05-20,10:00:00,Water,,manual,250,0.00,0.00,0.00,0.00,,,true,250.0,\r\n",
+)
 
-    entry = LogEntry(
+_CASE_ZERO = (
+    LogEntry(
         tenant_id="alice",
         log_date=date(2024, 5, 20),
         consumed_at=datetime(2024, 5, 20, 10, 0, 0, tzinfo=UTC),
-        product=product,
-        quantity_g=Decimal("250"),
-    )
+        product=GeneralizedProduct(
+            id="test-zero",
+            source=DataSource.MANUAL,
+            name="Zero Product",
+            macronutrients=Macronutrients(
+                calories_kcal=Decimal("0"),
+                protein_g=Decimal("0"),
+                carbohydrates_g=Decimal("0"),
+                fat_g=Decimal("0"),
+                fiber_g=Decimal("0"),
+                sugar_g=Decimal("0"),
+            ),
+            is_liquid=True,
+            volume_ml_per_100g=Decimal("0"),
+        ),
+        quantity_g=Decimal("100"),
+    ),
+    "2024-05-20,10:00:00,Zero Product,,manual,100,0.00,0.00,0.00,0.00,0.00,0.00,true,0.0,\r\n",
+)
+
+
+@pytest.fixture(
+    scope="module",
+    params=[_CASE_DATA, _CASE_LIQUID, _CASE_ZERO],
+    ids=["with_data", "liquid", "zero_values"],
+)
+def csv_case(request: pytest.FixtureRequest) -> tuple[LogEntry, str]:
+    return request.param
+
+
+def test_generate_csv_row(csv_case: tuple[LogEntry, str]) -> None:
+    entry, expected_row = csv_case
+    service = ExportService()
 
     csv_gen = service.generate_csv([entry])
     next(csv_gen)  # Skip header
     row = next(csv_gen)
 
-    # 250g liquid with 100ml/100g -> 250ml
-    expected_row = "2024-05-20,10:00:00,Water,,manual,250,0.00,0.00,0.00,0.00,,,true,250.0,\r\n"
     assert row == expected_row
 
 
-def test_generate_csv_zero_values() -> None:
+def test_generate_csv_batches_rows() -> None:
     service = ExportService()
 
     product = GeneralizedProduct(
-        id="test-zero",
+        id="test-batch",
         source=DataSource.MANUAL,
-        name="Zero Product",
+        name="Batch Product",
         macronutrients=Macronutrients(
-            calories_kcal=Decimal("0"),
-            protein_g=Decimal("0"),
-            carbohydrates_g=Decimal("0"),
-            fat_g=Decimal("0"),
-            fiber_g=Decimal("0"),
-            sugar_g=Decimal("0"),
+            calories_kcal=Decimal("100"),
+            protein_g=Decimal("10"),
+            carbohydrates_g=Decimal("20"),
+            fat_g=Decimal("5"),
         ),
-        is_liquid=True,
-        volume_ml_per_100g=Decimal("0"),
     )
-
     entry = LogEntry(
         tenant_id="alice",
         log_date=date(2024, 5, 20),
-        consumed_at=datetime(2024, 5, 20, 10, 0, 0, tzinfo=UTC),
+        consumed_at=datetime(2024, 5, 20, 8, 0, 0, tzinfo=UTC),
         product=product,
         quantity_g=Decimal("100"),
     )
 
-    csv_gen = service.generate_csv([entry])
-    next(csv_gen)  # Skip header
-    row = next(csv_gen)
+    chunks = list(service.generate_csv([entry] * (_BATCH_ROWS + 1)))
 
-    expected_row = (
-        "2024-05-20,10:00:00,Zero Product,,manual,100,0.00,0.00,0.00,0.00,0.00,0.00,true,0.0,\r\n"
+    # Header, ein voller Batch, ein Rest-Batch
+    assert len(chunks) == 3
+    assert chunks[1].count("\r\n") == _BATCH_ROWS
+    assert chunks[2] == (
+        "2024-05-20,08:00:00,Batch Product,,manual,100,100.00,10.00,20.00,5.00,,,false,,\r\n"
     )
-    assert row == expected_row
@@ -1,6 +1,6 @@
 from datetime import date
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -17,12 +17,14 @@ from app.services.log_service import LogService
 
 @pytest.fixture
 def mock_repo():
-    return MagicMock(spec=GoalsRepository)
+    return MagicMock(spec_set=GoalsRepository)
 
 
 @pytest.fixture
 def mock_log_service():
-    return MagicMock(spec=LogService)
+    # spec_set makes the async LogService methods AsyncMocks up front; tests only set
+    # return values instead of swapping in new AsyncMock objects.
+    return MagicMock(spec_set=LogService)
 
 
 @pytest.fixture
@@ -30,7 +32,6 @@ def goals_service(mock_repo, mock_log_service):
     return GoalsService(repository=mock_repo, log_service=mock_log_service)
 
 
-@pytest.mark.asyncio
 async def test_get_goals_returns_default_if_none(goals_service, mock_repo):
     mock_repo.get.return_value = None
     result = await goals_service.get_goals("tenant_1")
@@ -38,7 +39,6 @@ async def test_get_goals_returns_default_if_none(goals_service, mock_repo):
     mock_repo.get.assert_called_once_with("tenant_1")
 
 
-@pytest.mark.asyncio
 async def test_get_goals_returns_saved_goals(goals_service, mock_repo):
     goals = DailyGoals(calories_kcal=Decimal("2000"))
     mock_repo.get.return_value = goals
@@ -46,7 +46,6 @@ async def test_get_goals_returns_saved_goals(goals_service, mock_repo):
     assert result == goals
 
 
-@pytest.mark.asyncio
 async def test_update_goals(goals_service, mock_repo):
     goals = DailyGoals(calories_kcal=Decimal("2500"))
     mock_repo.save.return_value = goals
@@ -55,10 +54,9 @@ async def test_update_goals(goals_service, mock_repo):
     mock_repo.save.assert_called_once_with("tenant_1", goals)
 
 
-@pytest.mark.asyncio
-async def test_get_progress(goals_service, mock_repo, mock_log_service):
+async def test_get_progress(goals_service, mock_repo, mock_log_service, fixed_date: date):
     tenant_id = "tenant_1"
-    today = date.today()
+    today = fixed_date
 
     goals = DailyGoals(calories_kcal=Decimal("2000"), water_ml=Decimal("2000"))
     mock_repo.get.return_value = goals
@@ -73,12 +71,12 @@ async def test_get_progress(goals_service, mock_repo, mock_log_service):
             fat_g=Decimal("30"),
         ),
     )
-    mock_log_service.get_daily_nutrition = AsyncMock(return_value=nutrition)
+    mock_log_service.get_daily_nutrition.return_value = nutrition
 
     hydration = DailyHydrationSummary(
         log_date=today, total_volume_ml=Decimal("1500"), contributing_entries=2
     )
-    mock_log_service.get_daily_hydration = AsyncMock(return_value=hydration)
+    mock_log_service.get_daily_hydration.return_value = hydration
 
     progress = await goals_service.get_progress(tenant_id, today)
 
@@ -0,0 +1,31 @@
+from datetime import UTC, date, datetime
+from decimal import Decimal
+
+from app.domain.models import GeneralizedProduct, LogEntry
+from app.repositories.log_repository import InMemoryLogRepository
+
+
+def _entry(tenant_id: str, product: GeneralizedProduct, log_date: date) -> LogEntry:
+    return LogEntry(
+        tenant_id=tenant_id,
+        log_date=log_date,
+        product=product,
+        quantity_g=Decimal("100"),
+        consumed_at=datetime(2025, 6, 15, 12, 0, tzinfo=UTC),
+    )
+
+
+async def test_save_many_keeps_tenants_apart(solid_product, fixed_date):
+    repo = InMemoryLogRepository()
+    alice_1 = _entry("alice", solid_product, fixed_date)
+    alice_2 = _entry("alice", solid_product, fixed_date)
+    bob = _entry("bob", solid_product, fixed_date)
+
+    saved = await repo.save_many([alice_1, bob, alice_2])
+    assert saved == [alice_1, bob, alice_2]
+
+    alice_entries = await repo.find_by_date("alice", fixed_date)
+    assert {e.id for e in alice_entries} == {alice_1.id, alice_2.id}
+
+    bob_entries = await repo.find_by_date("bob", fixed_date)
+    assert [e.id for e in bob_entries] == [bob.id]
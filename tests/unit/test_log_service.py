@@ -1,6 +1,8 @@
 # tests/unit/test_log_service.py
+from collections.abc import Callable
 from datetime import date
 from decimal import Decimal
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -11,7 +13,6 @@ from app.domain.models import (
     GeneralizedProduct,
     LogEntryCreate,
     LogEntryUpdate,
-    Macronutrients,
 )
 from app.repositories.goals_repository import GoalsRepository
 from app.repositories.log_repository import InMemoryLogRepository
@@ -19,102 +20,94 @@ from app.services.log_service import LogService
 from app.services.notification_service import NotificationService
 from app.services.product_cache import ProductCache
 
+# Payloads are only read by the service, so one pre-built instance per quantity is
+# shared; model_construct skips re-validating hand-crafted values.
+_CREATE_100G = LogEntryCreate.model_construct(
+    product_id="test-123", source=DataSource.OPEN_FOOD_FACTS, quantity_g=Decimal("100")
+)
+_CREATE_200G = _CREATE_100G.model_copy(update={"quantity_g": Decimal("200")})
+_CREATE_250G = _CREATE_100G.model_copy(update={"quantity_g": Decimal("250")})
 
-def _make_product(is_liquid: bool = False) -> GeneralizedProduct:
-    return GeneralizedProduct(
-        id="test-123",
-        source=DataSource.OPEN_FOOD_FACTS,
-        name="Test Product",
-        macronutrients=Macronutrients(
-            calories_kcal=Decimal("100"),
-            protein_g=Decimal("10"),
-            carbohydrates_g=Decimal("50"),
-            fat_g=Decimal("5"),
-        ),
-        is_liquid=is_liquid,
-        volume_ml_per_100g=Decimal("100") if is_liquid else None,
-    )
 
+@pytest.fixture(scope="module")
+def shared_repo() -> InMemoryLogRepository:
+    return InMemoryLogRepository()
 
-@pytest.mark.asyncio
-async def test_daily_hydration_only_counts_liquids():
-    mock_adapter = AsyncMock()
-    mock_adapter.fetch_by_id.return_value = _make_product(is_liquid=True)
 
-    repo = InMemoryLogRepository()
-    cache = ProductCache(ttl_seconds=60)
-    service = LogService(
-        adapter_registry={DataSource.OPEN_FOOD_FACTS: mock_adapter},
-        repository=repo,
-        product_cache=cache,
-    )
+@pytest.fixture
+def make_service(shared_repo: InMemoryLogRepository) -> Callable[..., LogService]:
+    # One repository per module, emptied per test. The cache stays per service: the
+    # stubs serve different products under the same id, so a shared cache would leak.
+    shared_repo.clear()
 
-    payload = LogEntryCreate(
-        product_id="test-123", source=DataSource.OPEN_FOOD_FACTS, quantity_g=Decimal("250")
-    )
+    def _make(adapter_registry: dict[DataSource, Any], **kwargs: Any) -> LogService:
+        return LogService(
+            adapter_registry=adapter_registry,
+            repository=shared_repo,
+            product_cache=ProductCache(ttl_seconds=60),
+            **kwargs,
+        )
+
+    return _make
+
+
+class _StubAdapter:
+    """Plain coroutine stand-in for a ProductSourcePort; cheaper to await than an AsyncMock."""
+
+    def __init__(self, product: GeneralizedProduct) -> None:
+        self._product = product
+
+    async def fetch_by_id(self, product_id: str) -> GeneralizedProduct:
+        return self._product
+
+
+async def test_daily_hydration_only_counts_liquids(
+    make_service: Callable[..., LogService], liquid_product: GeneralizedProduct, fixed_date: date
+):
+    stub_adapter = _StubAdapter(liquid_product)
+
+    service = make_service({DataSource.OPEN_FOOD_FACTS: stub_adapter})
+
+    payload = _CREATE_250G.model_copy(update={"log_date": fixed_date})
     await service.create_entry("tenant_alice", payload)
 
-    summary = await service.get_daily_hydration("tenant_alice", date.today())
+    summary = await service.get_daily_hydration("tenant_alice", fixed_date)
     assert summary.total_volume_ml == Decimal("250.0")
     assert summary.contributing_entries == 1
 
 
-@pytest.mark.asyncio
-async def test_tenant_isolation():
-    mock_adapter = AsyncMock()
-    mock_adapter.fetch_by_id.return_value = _make_product()
+async def test_tenant_isolation(
+    make_service: Callable[..., LogService], solid_product: GeneralizedProduct, fixed_date: date
+):
+    stub_adapter = _StubAdapter(solid_product)
 
-    repo = InMemoryLogRepository()
-    cache = ProductCache(ttl_seconds=60)
-    service = LogService(
-        adapter_registry={DataSource.OPEN_FOOD_FACTS: mock_adapter},
-        repository=repo,
-        product_cache=cache,
-    )
+    service = make_service({DataSource.OPEN_FOOD_FACTS: stub_adapter})
 
-    payload = LogEntryCreate(
-        product_id="test-123", source=DataSource.OPEN_FOOD_FACTS, quantity_g=Decimal("100")
-    )
+    payload = _CREATE_100G.model_copy(update={"log_date": fixed_date})
     await service.create_entry("tenant_alice", payload)
 
     # Bob sieht Alices Daten nicht
-    bob_entries = await service.get_entries_for_date("tenant_bob", date.today())
+    bob_entries = await service.get_entries_for_date("tenant_bob", fixed_date)
     assert len(bob_entries) == 0
 
 
-@pytest.mark.asyncio
-async def test_get_nutrition_range():
-    mock_adapter = AsyncMock()
-    mock_adapter.fetch_by_id.return_value = _make_product()
+async def test_get_nutrition_range(
+    make_service: Callable[..., LogService], solid_product: GeneralizedProduct
+):
+    stub_adapter = _StubAdapter(solid_product)
 
-    repo = InMemoryLogRepository()
-    cache = ProductCache(ttl_seconds=60)
-    service = LogService(
-        adapter_registry={DataSource.OPEN_FOOD_FACTS: mock_adapter},
-        repository=repo,
-        product_cache=cache,
-    )
+    service = make_service({DataSource.OPEN_FOOD_FACTS: stub_adapter})
 
     d1 = date(2025, 1, 1)
     d2 = date(2025, 1, 2)
 
     await service.create_entry(
         "tenant_alice",
-        LogEntryCreate(
-            product_id="test-123",
-            source=DataSource.OPEN_FOOD_FACTS,
-            quantity_g=Decimal("100"),
-            log_date=d1,
-        ),
+        _CREATE_100G.model_copy(update={"log_date": d1}),
     )
     await service.create_entry(
         "tenant_alice",
-        LogEntryCreate(
-            product_id="test-123",
-            source=DataSource.OPEN_FOOD_FACTS,
-            quantity_g=Decimal("200"),
-            log_date=d2,
-        ),
+        _CREATE_200G.model_copy(update={"log_date": d2}),
     )
 
     summaries = await service.get_nutrition_range("tenant_alice", d1, d2)
@@ -125,30 +118,19 @@ async def test_get_nutrition_range():
     assert summaries[1].totals.calories_kcal == Decimal("200.00")
 
 
-@pytest.mark.asyncio
-async def test_get_hydration_range():
-    mock_adapter = AsyncMock()
-    mock_adapter.fetch_by_id.return_value = _make_product(is_liquid=True)
+async def test_get_hydration_range(
+    make_service: Callable[..., LogService], liquid_product: GeneralizedProduct
+):
+    stub_adapter = _StubAdapter(liquid_product)
 
-    repo = InMemoryLogRepository()
-    cache = ProductCache(ttl_seconds=60)
-    service = LogService(
-        adapter_registry={DataSource.OPEN_FOOD_FACTS: mock_adapter},
-        repository=repo,
-        product_cache=cache,
-    )
+    service = make_service({DataSource.OPEN_FOOD_FACTS: stub_adapter})
 
     d1 = date(2025, 1, 1)
     d2 = date(2025, 1, 2)
 
     await service.create_entry(
         "tenant_alice",
-        LogEntryCreate(
-            product_id="test-123",
-            source=DataSource.OPEN_FOOD_FACTS,
-            quantity_g=Decimal("100"),
-            log_date=d1,
-        ),
+        _CREATE_100G.model_copy(update={"log_date": d1}),
     )
     # Day 2 has no entries
 
@@ -160,60 +142,35 @@ async def test_get_hydration_range():
     assert summaries[1].total_volume_ml == Decimal("0")
 
 
-@pytest.mark.asyncio
-async def test_get_entry_returns_existing_entry():
-    mock_adapter = AsyncMock()
-    mock_adapter.fetch_by_id.return_value = _make_product()
+async def test_get_entry_returns_existing_entry(
+    make_service: Callable[..., LogService], solid_product: GeneralizedProduct
+):
+    stub_adapter = _StubAdapter(solid_product)
 
-    repo = InMemoryLogRepository()
-    cache = ProductCache(ttl_seconds=60)
-    service = LogService(
-        adapter_registry={DataSource.OPEN_FOOD_FACTS: mock_adapter},
-        repository=repo,
-        product_cache=cache,
-    )
+    service = make_service({DataSource.OPEN_FOOD_FACTS: stub_adapter})
 
-    payload = LogEntryCreate(
-        product_id="test-123", source=DataSource.OPEN_FOOD_FACTS, quantity_g=Decimal("100")
-    )
-    created = await service.create_entry("tenant_alice", payload)
+    created = await service.create_entry("tenant_alice", _CREATE_100G)
 
     found = await service.get_entry("tenant_alice", created.id)
     assert found is not None
     assert found.id == created.id
 
 
-@pytest.mark.asyncio
-async def test_get_entry_returns_none_for_unknown():
-    repo = InMemoryLogRepository()
-    cache = ProductCache(ttl_seconds=60)
-    service = LogService(
-        adapter_registry={},
-        repository=repo,
-        product_cache=cache,
-    )
+async def test_get_entry_returns_none_for_unknown(make_service: Callable[..., LogService]):
+    service = make_service({})
 
     result = await service.get_entry("tenant_alice", "does-not-exist")
     assert result is None
 
 
-@pytest.mark.asyncio
-async def test_update_entry_changes_quantity():
-    mock_adapter = AsyncMock()
-    mock_adapter.fetch_by_id.return_value = _make_product()
+async def test_update_entry_changes_quantity(
+    make_service: Callable[..., LogService], solid_product: GeneralizedProduct
+):
+    stub_adapter = _StubAdapter(solid_product)
 
-    repo = InMemoryLogRepository()
-    cache = ProductCache(ttl_seconds=60)
-    service = LogService(
-        adapter_registry={DataSource.OPEN_FOOD_FACTS: mock_adapter},
-        repository=repo,
-        product_cache=cache,
-    )
+    service = make_service({DataSource.OPEN_FOOD_FACTS: stub_adapter})
 
-    payload = LogEntryCreate(
-        product_id="test-123", source=DataSource.OPEN_FOOD_FACTS, quantity_g=Decimal("100")
-    )
-    created = await service.create_entry("tenant_alice", payload)
+    created = await service.create_entry("tenant_alice", _CREATE_100G)
 
     update = LogEntryUpdate(quantity_g=Decimal("250"))
     updated = await service.update_entry("tenant_alice", created.id, update)
@@ -223,38 +180,22 @@ async def test_update_entry_changes_quantity():
     assert updated.id == created.id
 
 
-@pytest.mark.asyncio
-async def test_update_entry_returns_none_for_unknown():
-    repo = InMemoryLogRepository()
-    cache = ProductCache(ttl_seconds=60)
-    service = LogService(
-        adapter_registry={},
-        repository=repo,
-        product_cache=cache,
-    )
+async def test_update_entry_returns_none_for_unknown(make_service: Callable[..., LogService]):
+    service = make_service({})
 
     update = LogEntryUpdate(quantity_g=Decimal("250"))
     result = await service.update_entry("tenant_alice", "does-not-exist", update)
     assert result is None
 
 
-@pytest.mark.asyncio
-async def test_delete_entry_returns_true_on_success():
-    mock_adapter = AsyncMock()
-    mock_adapter.fetch_by_id.return_value = _make_product()
+async def test_delete_entry_returns_true_on_success(
+    make_service: Callable[..., LogService], solid_product: GeneralizedProduct
+):
+    stub_adapter = _StubAdapter(solid_product)
 
-    repo = InMemoryLogRepository()
-    cache = ProductCache(ttl_seconds=60)
-    service = LogService(
-        adapter_registry={DataSource.OPEN_FOOD_FACTS: mock_adapter},
-        repository=repo,
-        product_cache=cache,
-    )
+    service = make_service({DataSource.OPEN_FOOD_FACTS: stub_adapter})
 
-    payload = LogEntryCreate(
-        product_id="test-123", source=DataSource.OPEN_FOOD_FACTS, quantity_g=Decimal("100")
-    )
-    created = await service.create_entry("tenant_alice", payload)
+    created = await service.create_entry("tenant_alice", _CREATE_100G)
 
     deleted = await service.delete_entry("tenant_alice", created.id)
     assert deleted is True
@@ -263,73 +204,52 @@ async def test_delete_entry_returns_true_on_success():
     assert found is None
 
 
-@pytest.mark.asyncio
-async def test_delete_entry_returns_false_for_unknown():
-    repo = InMemoryLogRepository()
-    cache = ProductCache(ttl_seconds=60)
-    service = LogService(
-        adapter_registry={},
-        repository=repo,
-        product_cache=cache,
-    )
+async def test_delete_entry_returns_false_for_unknown(make_service: Callable[..., LogService]):
+    service = make_service({})
 
     result = await service.delete_entry("tenant_alice", "does-not-exist")
     assert result is False
 
 
-@pytest.mark.asyncio
-async def test_handle_notifications_sends_first_log_of_day():
-    mock_adapter = AsyncMock()
-    mock_adapter.fetch_by_id.return_value = _make_product()
+async def test_handle_notifications_sends_first_log_of_day(
+    make_service: Callable[..., LogService], solid_product: GeneralizedProduct
+):
+    stub_adapter = _StubAdapter(solid_product)
 
-    repo = InMemoryLogRepository()
-    cache = ProductCache(ttl_seconds=60)
     mock_notification_service = MagicMock(spec=NotificationService)
     mock_notification_service.send = AsyncMock()
 
-    service = LogService(
-        adapter_registry={DataSource.OPEN_FOOD_FACTS: mock_adapter},
-        repository=repo,
-        product_cache=cache,
+    service = make_service(
+        {DataSource.OPEN_FOOD_FACTS: stub_adapter},
         notification_service=mock_notification_service,
     )
 
-    payload = LogEntryCreate(
-        product_id="test-123", source=DataSource.OPEN_FOOD_FACTS, quantity_g=Decimal("100")
-    )
-    await service.create_entry("tenant_alice", payload)
+    await service.create_entry("tenant_alice", _CREATE_100G)
 
     mock_notification_service.send.assert_called_once()
     call_args = mock_notification_service.send.call_args
     assert "Logging started" in call_args.args[1]
 
 
-@pytest.mark.asyncio
-async def test_handle_notifications_calorie_goal_reached():
-    mock_adapter = AsyncMock()
-    mock_adapter.fetch_by_id.return_value = _make_product()  # 100 kcal per 100g
+async def test_handle_notifications_calorie_goal_reached(
+    make_service: Callable[..., LogService], solid_product: GeneralizedProduct
+):
+    stub_adapter = _StubAdapter(solid_product)  # 100 kcal per 100g
 
-    repo = InMemoryLogRepository()
-    cache = ProductCache(ttl_seconds=60)
     mock_notification_service = MagicMock(spec=NotificationService)
     mock_notification_service.send = AsyncMock()
 
     goals_repo = GoalsRepository()
     goals_repo.save("tenant_alice", DailyGoals(calories_kcal=Decimal("100")))
 
-    service = LogService(
-        adapter_registry={DataSource.OPEN_FOOD_FACTS: mock_adapter},
-        repository=repo,
-        product_cache=cache,
+    service = make_service(
+        {DataSource.OPEN_FOOD_FACTS: stub_adapter},
         notification_service=mock_notification_service,
         goals_repository=goals_repo,
     )
 
     # Log exactly 100g of a 100kcal/100g product -> reaches the 100 kcal goal
-    payload = LogEntryCreate(
-        product_id="test-123", source=DataSource.OPEN_FOOD_FACTS, quantity_g=Decimal("100")
-    )
-    await service.create_entry("tenant_alice", payload)
+    await service.create_entry("tenant_alice", _CREATE_100G)
 
     # send called twice: first-log and goal-reached
     assert mock_notification_service.send.call_count == 2
@@ -337,22 +257,15 @@ async def test_handle_notifications_calorie_goal_reached():
     assert "Goal Reached!" in titles
 
 
-@pytest.mark.asyncio
-async def test_handle_notifications_no_service_does_not_raise():
-    mock_adapter = AsyncMock()
-    mock_adapter.fetch_by_id.return_value = _make_product()
+async def test_handle_notifications_no_service_does_not_raise(
+    make_service: Callable[..., LogService], solid_product: GeneralizedProduct
+):
+    stub_adapter = _StubAdapter(solid_product)
 
-    repo = InMemoryLogRepository()
-    cache = ProductCache(ttl_seconds=60)
-    service = LogService(
-        adapter_registry={DataSource.OPEN_FOOD_FACTS: mock_adapter},
-        repository=repo,
-        product_cache=cache,
+    service = make_service(
+        {DataSource.OPEN_FOOD_FACTS: stub_adapter},
         # no notification_service
     )
 
-    payload = LogEntryCreate(
-        product_id="test-123", source=DataSource.OPEN_FOOD_FACTS, quantity_g=Decimal("100")
-    )
     # Should not raise
-    await service.create_entry("tenant_alice", payload)
+    await service.create_entry("tenant_alice", _CREATE_100G)
@@ -1,74 +1,90 @@
+from collections.abc import Mapping
+from decimal import Decimal
+
+import pytest
 from fastapi.testclient import TestClient
 from prometheus_client import REGISTRY
 
-from app.domain.models import DataSource
+from app.domain.models import DataSource, GeneralizedProduct, Macronutrients
 from app.main import app
 from app.services.product_cache import ProductCache
 
+_Samples = Mapping[tuple[str, frozenset[tuple[str, str]]], float]
+
+_PRODUCT = GeneralizedProduct(
+    id="123",
+    source=DataSource.OPEN_FOOD_FACTS,
+    name="Test",
+    barcode="123",
+    macronutrients=Macronutrients(
+        calories_kcal=Decimal("0"),
+        protein_g=Decimal("0"),
+        carbohydrates_g=Decimal("0"),
+        fat_g=Decimal("0"),
+    ),
+)
+
+
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    return TestClient(app)
+
+
+@pytest.fixture(scope="module")
+def cache() -> ProductCache:
+    return ProductCache(ttl_seconds=60)
 
-def test_request_count_middleware() -> None:
-    client = TestClient(app)
 
-    # Get initial value (if any)
-    def get_count(method: str, path: str, status_code: str) -> float:
-        return REGISTRY.get_sample_value(
-            "http_requests_total",
-            {"method": method, "path": path, "status_code": status_code}
-        ) or 0.0
+def _snapshot(*names: str) -> _Samples:
+    # One pass over all collectors instead of one REGISTRY.get_sample_value() walk per
+    # lookup; only samples of the requested metrics are kept.
+    return {
+        (sample.name, frozenset(sample.labels.items())): sample.value
+        for metric in REGISTRY.collect()
+        for sample in metric.samples
+        if sample.name in names
+    }
 
-    initial = get_count("GET", "/healthz", "200")
+
+def _value(samples: _Samples, name: str, labels: Mapping[str, str] | None = None) -> float:
+    return samples.get((name, frozenset((labels or {}).items())), 0.0)
+
+
+def test_request_count_middleware(client: TestClient) -> None:
+    labels = {"method": "GET", "path": "/healthz", "status_code": "200"}
+    initial = _value(_snapshot("http_requests_total"), "http_requests_total", labels)
 
     # Make a request
     response = client.get("/healthz")
     assert response.status_code == 200
 
-    final = get_count("GET", "/healthz", "200")
+    final = _value(_snapshot("http_requests_total"), "http_requests_total", labels)
     assert final == initial + 1
 
 
-def test_metrics_endpoint_unauthenticated() -> None:
-    client = TestClient(app)
+def test_metrics_endpoint_unauthenticated(client: TestClient) -> None:
     response = client.get("/metrics")
     assert response.status_code == 200
     assert "http_requests_total" in response.text
 
 
-def test_cache_metrics() -> None:
-    cache = ProductCache(ttl_seconds=60)
+_CACHE_METRICS = ("cache_hits_total", "cache_misses_total")
 
-    def get_hits() -> float:
-        return REGISTRY.get_sample_value("cache_hits_total") or 0.0
 
-    def get_misses() -> float:
-        return REGISTRY.get_sample_value("cache_misses_total") or 0.0
-
-    initial_hits = get_hits()
-    initial_misses = get_misses()
+def test_cache_metrics(cache: ProductCache) -> None:
+    before = _snapshot(*_CACHE_METRICS)
+    initial_hits = _value(before, "cache_hits_total")
+    initial_misses = _value(before, "cache_misses_total")
 
     # Miss
     cache.get(DataSource.OPEN_FOOD_FACTS, "nonexistent")
-    assert get_misses() == initial_misses + 1
-    assert get_hits() == initial_hits
+    after_miss = _snapshot(*_CACHE_METRICS)
+    assert _value(after_miss, "cache_misses_total") == initial_misses + 1
+    assert _value(after_miss, "cache_hits_total") == initial_hits
 
     # Hit
-    from decimal import Decimal
-
-    from app.domain.models import GeneralizedProduct, Macronutrients
-
-    product = GeneralizedProduct(
-        id="123",
-        source=DataSource.OPEN_FOOD_FACTS,
-        name="Test",
-        barcode="123",
-        macronutrients=Macronutrients(
-            calories_kcal=Decimal("0"),
-            protein_g=Decimal("0"),
-            carbohydrates_g=Decimal("0"),
-            fat_g=Decimal("0"),
-        )
-    )
-    cache.set(DataSource.OPEN_FOOD_FACTS, "123", product)
+    cache.set(DataSource.OPEN_FOOD_FACTS, "123", _PRODUCT)
     cache.get(DataSource.OPEN_FOOD_FACTS, "123")
-
-    assert get_hits() == initial_hits + 1
-    assert get_misses() == initial_misses + 1
+    after_hit = _snapshot(*_CACHE_METRICS)
+    assert _value(after_hit, "cache_hits_total") == initial_hits + 1
+    assert _value(after_hit, "cache_misses_total") == initial_misses + 1
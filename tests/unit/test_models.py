@@ -1,4 +1,5 @@
 # tests/unit/test_models.py
+from contextlib import AbstractContextManager, nullcontext
 from datetime import date
 from decimal import Decimal
 
@@ -14,6 +15,17 @@ from app.domain.models import (
     Micronutrients,
 )
 
+# Expected scaled values, parsed once per module instead of in every assertion
+_D0_00 = Decimal("0.00")
+_D2_50 = Decimal("2.50")
+_D5_00 = Decimal("5.00")
+_D8_00 = Decimal("8.00")
+_D15_00 = Decimal("15.00")
+_D16_00 = Decimal("16.00")
+_D100_00 = Decimal("100.00")
+_D100 = Decimal(100)
+_D250_0 = Decimal("250.0")
+
 
 def _make_product(
     calories: str = "200",
@@ -22,13 +34,14 @@ def _make_product(
     fat: str = "5",
     fiber: str | None = None,
     sugar: str | None = None,
-    is_liquid: bool = False,
 ) -> GeneralizedProduct:
-    return GeneralizedProduct(
+    # model_construct skips validation: the inputs are hand-crafted valid values, and
+    # these tests exercise LogEntry, not the product validators (tested further below).
+    return GeneralizedProduct.model_construct(
         id="prod-1",
         source=DataSource.MANUAL,
         name="Test Product",
-        macronutrients=Macronutrients(
+        macronutrients=Macronutrients.model_construct(
             calories_kcal=Decimal(calories),
             protein_g=Decimal(protein),
             carbohydrates_g=Decimal(carbs),
@@ -36,8 +49,6 @@ def _make_product(
             fiber_g=Decimal(fiber) if fiber is not None else None,
             sugar_g=Decimal(sugar) if sugar is not None else None,
         ),
-        is_liquid=is_liquid,
-        volume_ml_per_100g=Decimal("100") if is_liquid else None,
     )
 
 
@@ -55,10 +66,10 @@ def test_scaled_macros_scales_proportionally():
     )
 
     scaled = entry.scaled_macros
-    assert scaled.calories_kcal == Decimal("100.00")
-    assert scaled.protein_g == Decimal("5.00")
-    assert scaled.carbohydrates_g == Decimal("15.00")
-    assert scaled.fat_g == Decimal("2.50")
+    assert scaled.calories_kcal == _D100_00
+    assert scaled.protein_g == _D5_00
+    assert scaled.carbohydrates_g == _D15_00
+    assert scaled.fat_g == _D2_50
 
 
 def test_scaled_macros_optional_fields_none_when_product_has_none():
@@ -75,8 +86,8 @@ def test_scaled_macros_optional_fields_scaled_when_present():
     entry = LogEntry(tenant_id="alice", product=product, quantity_g=Decimal("200"))
 
     scaled = entry.scaled_macros
-    assert scaled.fiber_g == Decimal("8.00")
-    assert scaled.sugar_g == Decimal("16.00")
+    assert scaled.fiber_g == _D8_00
+    assert scaled.sugar_g == _D16_00
 
 
 def test_scaled_macros_zero_optional_fields_not_lost():
@@ -85,8 +96,8 @@ def test_scaled_macros_zero_optional_fields_not_lost():
     entry = LogEntry(tenant_id="alice", product=product, quantity_g=Decimal("100"))
 
     scaled = entry.scaled_macros
-    assert scaled.fiber_g == Decimal("0.00")
-    assert scaled.sugar_g == Decimal("0.00")
+    assert scaled.fiber_g == _D0_00
+    assert scaled.sugar_g == _D0_00
 
 
 # ---------------------------------------------------------------------------
@@ -94,17 +105,15 @@ def test_scaled_macros_zero_optional_fields_not_lost():
 # ---------------------------------------------------------------------------
 
 
-def test_consumed_volume_ml_for_liquid():
-    product = _make_product(is_liquid=True)
-    entry = LogEntry(tenant_id="alice", product=product, quantity_g=Decimal("250"))
+def test_consumed_volume_ml_for_liquid(liquid_product: GeneralizedProduct):
+    entry = LogEntry(tenant_id="alice", product=liquid_product, quantity_g=Decimal("250"))
 
     # 250g * (100ml / 100g) = 250ml
-    assert entry.consumed_volume_ml == Decimal("250.0")
+    assert entry.consumed_volume_ml == _D250_0
 
 
-def test_consumed_volume_ml_for_non_liquid_is_none():
-    product = _make_product(is_liquid=False)
-    entry = LogEntry(tenant_id="alice", product=product, quantity_g=Decimal("100"))
+def test_consumed_volume_ml_for_non_liquid_is_none(solid_product: GeneralizedProduct):
+    entry = LogEntry(tenant_id="alice", product=solid_product, quantity_g=Decimal("100"))
 
     assert entry.consumed_volume_ml is None
 
@@ -152,34 +161,33 @@ def test_generalized_product_non_liquid_without_volume_is_valid():
 # ---------------------------------------------------------------------------
 
 
-def test_manual_product_create_liquid_without_volume_raises():
-    with pytest.raises(ValueError, match="volume_ml_per_100g"):
-        ManualProductCreate(
-            name="Juice",
-            macronutrients=Macronutrients(
-                calories_kcal=Decimal("40"),
-                protein_g=Decimal("0"),
-                carbohydrates_g=Decimal("10"),
-                fat_g=Decimal("0"),
-            ),
-            is_liquid=True,
-            volume_ml_per_100g=None,
-        )
+_LEMONADE_MACROS = Macronutrients(
+    calories_kcal=Decimal("30"),
+    protein_g=Decimal("0"),
+    carbohydrates_g=Decimal("8"),
+    fat_g=Decimal("0"),
+)
 
 
-def test_manual_product_create_liquid_with_volume_is_valid():
-    product = ManualProductCreate(
-        name="Homemade Lemonade",
-        macronutrients=Macronutrients(
-            calories_kcal=Decimal("30"),
-            protein_g=Decimal("0"),
-            carbohydrates_g=Decimal("8"),
-            fat_g=Decimal("0"),
-        ),
-        is_liquid=True,
-        volume_ml_per_100g=Decimal("100"),
-    )
-    assert product.volume_ml_per_100g == Decimal("100")
+@pytest.mark.parametrize(
+    ("volume_ml_per_100g", "expectation"),
+    [
+        (None, pytest.raises(ValueError, match="volume_ml_per_100g")),
+        (_D100, nullcontext()),
+    ],
+    ids=["liquid_without_volume_raises", "liquid_with_volume_is_valid"],
+)
+def test_manual_product_create_liquid_volume(
+    volume_ml_per_100g: Decimal | None, expectation: AbstractContextManager[object]
+):
+    with expectation:
+        product = ManualProductCreate(
+            name="Homemade Lemonade",
+            macronutrients=_LEMONADE_MACROS,
+            is_liquid=True,
+            volume_ml_per_100g=volume_ml_per_100g,
+        )
+        assert product.volume_ml_per_100g == volume_ml_per_100g
 
 
 # ---------------------------------------------------------------------------
@@ -187,25 +195,23 @@ def test_manual_product_create_liquid_with_volume_is_valid():
 # ---------------------------------------------------------------------------
 
 
-def test_date_range_params_valid():
-    dr = DateRangeParams(start_date=date(2025, 1, 1), end_date=date(2025, 1, 31))
-    assert dr.start_date == date(2025, 1, 1)
-    assert dr.end_date == date(2025, 1, 31)
-
-
-def test_date_range_params_same_day_valid():
-    dr = DateRangeParams(start_date=date(2025, 6, 15), end_date=date(2025, 6, 15))
-    assert dr.start_date == dr.end_date
-
-
-def test_date_range_params_end_before_start_raises():
-    with pytest.raises(ValueError, match="after or equal"):
-        DateRangeParams(start_date=date(2025, 2, 1), end_date=date(2025, 1, 1))
-
-
-def test_date_range_params_too_long_raises():
-    with pytest.raises(ValueError, match="366 days"):
-        DateRangeParams(start_date=date(2024, 1, 1), end_date=date(2025, 2, 2))
+@pytest.mark.parametrize(
+    ("start_date", "end_date", "expectation"),
+    [
+        (date(2025, 1, 1), date(2025, 1, 31), nullcontext()),
+        (date(2025, 6, 15), date(2025, 6, 15), nullcontext()),
+        (date(2025, 2, 1), date(2025, 1, 1), pytest.raises(ValueError, match="after or equal")),
+        (date(2024, 1, 1), date(2025, 2, 2), pytest.raises(ValueError, match="366 days")),
+    ],
+    ids=["valid", "same_day_valid", "end_before_start_raises", "too_long_raises"],
+)
+def test_date_range_params(
+    start_date: date, end_date: date, expectation: AbstractContextManager[object]
+):
+    with expectation:
+        dr = DateRangeParams(start_date=start_date, end_date=end_date)
+        assert dr.start_date == start_date
+        assert dr.end_date == end_date
 
 
 # ---------------------------------------------------------------------------
@@ -1,80 +1,80 @@
 import asyncio
-from unittest.mock import AsyncMock, MagicMock
+import json
+from dataclasses import dataclass
 
 import httpx
 import pytest
+import respx
 
-from app.core.config import Settings
-from app.services.notification_service import NotificationService
+from app.services.notification_service import NotificationService, _background_tasks
 
+_NTFY_URL = "https://ntfy.sh/my-topic"
+_GOTIFY_URL = "https://gotify.example.com"
 
-@pytest.fixture
-def http_client():
-    return AsyncMock(spec=httpx.AsyncClient)
+
+@dataclass(slots=True)
+class _FakeSettings:
+    """The two Settings fields NotificationService reads; avoids specing a mock on Settings."""
+
+    webhook_enabled: bool = True
+    webhook_url: str = _NTFY_URL
 
 
 @pytest.fixture
-def settings():
-    s = MagicMock(spec=Settings)
-    s.webhook_enabled = True
-    s.webhook_url = "https://ntfy.sh/my-topic"
-    return s
+def settings() -> _FakeSettings:
+    return _FakeSettings()
 
 
-@pytest.mark.asyncio
-async def test_ntfy_sends_correct_request(http_client, settings):
+async def test_ntfy_sends_correct_request(http_client, settings, respx_mock: respx.MockRouter):
+    route = respx_mock.post(_NTFY_URL).respond(200)
     service = NotificationService(http_client, settings)
     await service.send("Test Title", "Test Message")
 
-    # Give the background task a moment to start
-    await asyncio.sleep(0.1)
+    # Wait for the fire-and-forget send instead of sleeping
+    await asyncio.gather(*_background_tasks)
 
-    http_client.post.assert_called_once_with(
-        "https://ntfy.sh/my-topic",
-        content="Test Message",
-        headers={"Title": "Test Title"},
-        timeout=10.0,
-    )
+    assert route.call_count == 1
+    request = route.calls.last.request
+    assert request.content == b"Test Message"
+    assert request.headers["Title"] == "Test Title"
+    assert request.extensions["timeout"]["read"] == 10.0
 
 
-@pytest.mark.asyncio
-async def test_gotify_sends_correct_json(http_client, settings):
-    settings.webhook_url = "https://gotify.example.com"
+async def test_gotify_sends_correct_json(http_client, settings, respx_mock: respx.MockRouter):
+    settings.webhook_url = _GOTIFY_URL
+    route = respx_mock.post(f"{_GOTIFY_URL}/message").respond(200)
     service = NotificationService(http_client, settings)
     await service.send("Test Title", "Test Message")
 
-    await asyncio.sleep(0.1)
+    await asyncio.gather(*_background_tasks)
 
-    http_client.post.assert_called_once_with(
-        "https://gotify.example.com/message",
-        json={
-            "title": "Test Title",
-            "message": "Test Message",
-            "priority": 5,
-        },
-        timeout=10.0,
-    )
+    assert route.call_count == 1
+    request = route.calls.last.request
+    assert request.extensions["timeout"]["read"] == 10.0
+    assert json.loads(request.content) == {
+        "title": "Test Title",
+        "message": "Test Message",
+        "priority": 5,
+    }
 
 
-@pytest.mark.asyncio
-async def test_disabled_webhook_skips_http(http_client, settings):
+async def test_disabled_webhook_skips_http(http_client, settings, respx_mock: respx.MockRouter):
     settings.webhook_enabled = False
     service = NotificationService(http_client, settings)
     await service.send("Test Title", "Test Message")
 
-    await asyncio.sleep(0.1)
-    http_client.post.assert_not_called()
+    assert not _background_tasks
+    assert not respx_mock.calls
 
 
-@pytest.mark.asyncio
-async def test_error_is_not_propagated(http_client, settings, caplog):
-    http_client.post.side_effect = httpx.RequestError("Network down")
+async def test_error_is_not_propagated(http_client, settings, respx_mock: respx.MockRouter, caplog):
+    respx_mock.post(_NTFY_URL).mock(side_effect=httpx.RequestError("Network down"))
     service = NotificationService(http_client, settings)
 
     # This should not raise an exception
     await service.send("Test Title", "Test Message")
 
-    await asyncio.sleep(0.1)
+    await asyncio.gather(*_background_tasks)
 
     # Check if error was logged
     assert "Failed to send notification" in caplog.text
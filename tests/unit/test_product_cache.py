@@ -1,63 +1,57 @@
-import time
 from decimal import Decimal
-from unittest.mock import patch
 
 from app.domain.models import DataSource, GeneralizedProduct, Macronutrients
 from app.services.product_cache import ProductCache
 
+# Macronutrients and GeneralizedProduct are frozen, so instances can be shared by all tests
+_MACROS_A = Macronutrients(
+    calories_kcal=Decimal("100"),
+    protein_g=Decimal("10"),
+    carbohydrates_g=Decimal("20"),
+    fat_g=Decimal("5"),
+)
+_MACROS_B = Macronutrients(
+    calories_kcal=Decimal("200"),
+    protein_g=Decimal("20"),
+    carbohydrates_g=Decimal("40"),
+    fat_g=Decimal("10"),
+)
+_PRODUCT = GeneralizedProduct(
+    id="123",
+    source=DataSource.OPEN_FOOD_FACTS,
+    name="Test Product",
+    macronutrients=_MACROS_A,
+)
+
 
 def test_cache_hit_and_miss():
     cache = ProductCache(ttl_seconds=60)
-    product = GeneralizedProduct(
-        id="123",
-        source=DataSource.OPEN_FOOD_FACTS,
-        name="Test Product",
-        macronutrients=Macronutrients(
-            calories_kcal=Decimal("100"),
-            protein_g=Decimal("10"),
-            carbohydrates_g=Decimal("20"),
-            fat_g=Decimal("5"),
-        ),
-    )
 
     # Miss
     assert cache.get(DataSource.OPEN_FOOD_FACTS, "123") is None
 
     # Set
-    cache.set(DataSource.OPEN_FOOD_FACTS, "123", product)
+    cache.set(DataSource.OPEN_FOOD_FACTS, "123", _PRODUCT)
 
     # Hit
     cached = cache.get(DataSource.OPEN_FOOD_FACTS, "123")
-    assert cached == product
+    assert cached == _PRODUCT
 
 
 def test_cache_ttl_expiry():
     ttl = 10
-    cache = ProductCache(ttl_seconds=ttl)
-    product = GeneralizedProduct(
-        id="123",
-        source=DataSource.OPEN_FOOD_FACTS,
-        name="Test Product",
-        macronutrients=Macronutrients(
-            calories_kcal=Decimal("100"),
-            protein_g=Decimal("10"),
-            carbohydrates_g=Decimal("20"),
-            fat_g=Decimal("5"),
-        ),
-    )
+    now = [1000.0]
+    cache = ProductCache(ttl_seconds=ttl, clock=lambda: now[0])
 
-    now = time.time()
-    with patch("time.time") as mock_time:
-        mock_time.return_value = now
-        cache.set(DataSource.OPEN_FOOD_FACTS, "123", product)
+    cache.set(DataSource.OPEN_FOOD_FACTS, "123", _PRODUCT)
 
-        # Still valid
-        mock_time.return_value = now + ttl - 1
-        assert cache.get(DataSource.OPEN_FOOD_FACTS, "123") == product
+    # Still valid
+    now[0] += ttl - 1
+    assert cache.get(DataSource.OPEN_FOOD_FACTS, "123") == _PRODUCT
 
-        # Expired
-        mock_time.return_value = now + ttl + 1
-        assert cache.get(DataSource.OPEN_FOOD_FACTS, "123") is None
+    # Expired
+    now[0] += 2
+    assert cache.get(DataSource.OPEN_FOOD_FACTS, "123") is None
 
 
 def test_cache_different_sources():
@@ -66,23 +60,13 @@ def test_cache_different_sources():
         id="123",
         source=DataSource.OPEN_FOOD_FACTS,
         name="OFF Product",
-        macronutrients=Macronutrients(
-            calories_kcal=Decimal("100"),
-            protein_g=Decimal("10"),
-            carbohydrates_g=Decimal("20"),
-            fat_g=Decimal("5"),
-        ),
+        macronutrients=_MACROS_A,
     )
     product_usda = GeneralizedProduct(
         id="123",
         source=DataSource.USDA_FOODDATA,
         name="USDA Product",
-        macronutrients=Macronutrients(
-            calories_kcal=Decimal("200"),
-            protein_g=Decimal("20"),
-            carbohydrates_g=Decimal("40"),
-            fat_g=Decimal("10"),
-        ),
+        macronutrients=_MACROS_B,
     )
 
     cache.set(DataSource.OPEN_FOOD_FACTS, "123", product_off)
@@ -90,3 +74,16 @@ def test_cache_different_sources():
 
     assert cache.get(DataSource.OPEN_FOOD_FACTS, "123") == product_off
     assert cache.get(DataSource.USDA_FOODDATA, "123") == product_usda
+
+
+def test_cache_lazy_eviction_bounded_memory():
+    max_size = 20
+    cache = ProductCache(ttl_seconds=60, max_size=max_size)
+
+    for i in range(max_size * 2):
+        cache.set(DataSource.OPEN_FOOD_FACTS, str(i), _PRODUCT)
+
+    assert len(cache._store) <= max_size
+    # Oldest entries are evicted first, the most recent one survives
+    assert cache.get(DataSource.OPEN_FOOD_FACTS, "0") is None
+    assert cache.get(DataSource.OPEN_FOOD_FACTS, str(max_size * 2 - 1)) == _PRODUCT
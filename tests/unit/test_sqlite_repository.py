@@ -1,44 +1,72 @@
-import uuid
+import itertools
 from datetime import UTC, date, datetime
 from decimal import Decimal
 
 import pytest
 import pytest_asyncio
+from sqlalchemy import delete
 
 from app.domain.models import DataSource, GeneralizedProduct, LogEntry, Macronutrients
-from app.repositories.sqlite_log_repository import SQLiteLogRepository
+from app.repositories.sqlite_log_repository import LogEntryORM, SQLiteLogRepository
 
 
-@pytest_asyncio.fixture
-async def sqlite_repo():
-    # Use in-memory SQLite for testing
+@pytest_asyncio.fixture(scope="module")
+async def _module_repo():
+    # One in-memory database and one create_all per module (session event loop)
     repo = SQLiteLogRepository("sqlite+aiosqlite:///:memory:")
     await repo.initialize()
-    return repo
+    yield repo
+    await repo.engine.dispose()
 
 
-def create_test_entry(tenant_id: str, entry_id: str = None) -> LogEntry:
+@pytest_asyncio.fixture
+async def sqlite_repo(_module_repo: SQLiteLogRepository):
+    # Start every test from empty tables instead of a freshly created schema
+    async with _module_repo.engine.begin() as conn:
+        await conn.execute(delete(LogEntryORM))
+    return _module_repo
+
+
+# Built once at import: GeneralizedProduct is frozen, and a fixed timestamp keeps any
+# future consumed_at assertion independent of wall-clock time and test order.
+_PRODUCT = GeneralizedProduct(
+    id="test-prod",
+    source=DataSource.MANUAL,
+    name="Test Product",
+    macronutrients=Macronutrients(
+        calories_kcal=Decimal("100"),
+        protein_g=Decimal("10"),
+        carbohydrates_g=Decimal("20"),
+        fat_g=Decimal("5"),
+    ),
+)
+_Q100 = Decimal("100")
+_D200 = Decimal("200")
+_FIXED_CONSUMED_AT = datetime(2024, 5, 20, 12, 0, tzinfo=UTC)
+
+
+# Test IDs only need to be unique within the process; a counter avoids the
+# os.urandom() call behind every uuid4().
+_id_counter = itertools.count()
+
+
+def _tid() -> str:
+    return f"test-{next(_id_counter):08x}"
+
+
+def create_test_entry(
+    tenant_id: str, *, entry_id: str | None = None, log_date: date = date(2024, 5, 20)
+) -> LogEntry:
     return LogEntry(
-        id=entry_id or str(uuid.uuid4()),
+        id=entry_id or _tid(),
         tenant_id=tenant_id,
-        log_date=date(2024, 5, 20),
-        product=GeneralizedProduct(
-            id="test-prod",
-            source=DataSource.MANUAL,
-            name="Test Product",
-            macronutrients=Macronutrients(
-                calories_kcal=Decimal("100"),
-                protein_g=Decimal("10"),
-                carbohydrates_g=Decimal("20"),
-                fat_g=Decimal("5"),
-            ),
-        ),
-        quantity_g=Decimal("100"),
-        consumed_at=datetime.now(UTC),
+        log_date=log_date,
+        product=_PRODUCT,
+        quantity_g=_Q100,
+        consumed_at=_FIXED_CONSUMED_AT,
     )
 
 
-@pytest.mark.asyncio
 async def test_save_and_find_by_id(sqlite_repo):
     tenant_id = "alice"
     entry = create_test_entry(tenant_id)
@@ -52,35 +80,26 @@ async def test_save_and_find_by_id(sqlite_repo):
     assert found.product.name == "Test Product"
 
 
-@pytest.mark.asyncio
-async def test_find_by_id_wrong_tenant(sqlite_repo):
-    entry = create_test_entry("alice")
+@pytest.mark.parametrize(
+    ("query_tenant", "query_date", "found_by_id", "found_by_date"),
+    [
+        ("alice", date(2024, 5, 20), True, True),
+        ("bob", date(2024, 5, 20), False, False),
+        ("alice", date(2024, 5, 21), True, False),
+    ],
+    ids=["hit", "wrong_tenant", "wrong_date"],
+)
+async def test_find_scoping(sqlite_repo, query_tenant, query_date, found_by_id, found_by_date):
+    entry = create_test_entry("alice", log_date=date(2024, 5, 20))
     await sqlite_repo.save(entry)
 
-    found = await sqlite_repo.find_by_id("bob", entry.id)
-    assert found is None
-
-
-@pytest.mark.asyncio
-async def test_find_by_date(sqlite_repo):
-    tenant_id = "alice"
-    entry1 = create_test_entry(tenant_id)
-    entry2 = create_test_entry(tenant_id)
-    entry2 = entry2.model_copy(update={"id": str(uuid.uuid4()), "log_date": date(2024, 5, 21)})
-
-    await sqlite_repo.save(entry1)
-    await sqlite_repo.save(entry2)
-
-    entries_20 = await sqlite_repo.find_by_date(tenant_id, date(2024, 5, 20))
-    assert len(entries_20) == 1
-    assert entries_20[0].id == entry1.id
+    found = await sqlite_repo.find_by_id(query_tenant, entry.id)
+    assert (found is not None) is found_by_id
 
-    entries_21 = await sqlite_repo.find_by_date(tenant_id, date(2024, 5, 21))
-    assert len(entries_21) == 1
-    assert entries_21[0].id == entry2.id
+    entries = await sqlite_repo.find_by_date(query_tenant, query_date)
+    assert [e.id for e in entries] == ([entry.id] if found_by_date else [])
 
 
-@pytest.mark.asyncio
 async def test_delete(sqlite_repo):
     tenant_id = "alice"
     entry = create_test_entry(tenant_id)
@@ -93,45 +112,31 @@ async def test_delete(sqlite_repo):
     assert found is None
 
 
-@pytest.mark.asyncio
 async def test_delete_nonexistent(sqlite_repo):
     deleted = await sqlite_repo.delete("alice", "nonexistent")
     assert deleted is False
 
 
-@pytest.mark.asyncio
 async def test_update(sqlite_repo):
     tenant_id = "alice"
     entry = create_test_entry(tenant_id)
     await sqlite_repo.save(entry)
 
-    updated_entry = entry.model_copy(update={"quantity_g": Decimal("200")})
+    updated_entry = entry.model_copy(update={"quantity_g": _D200})
     await sqlite_repo.update(updated_entry)
 
     found = await sqlite_repo.find_by_id(tenant_id, entry.id)
-    assert found.quantity_g == Decimal("200")
+    assert found.quantity_g == _D200
 
 
-@pytest.mark.asyncio
 async def test_find_by_date_range(sqlite_repo):
     tenant_id = "alice"
 
-    entry_inside_1 = create_test_entry(tenant_id)
-    entry_inside_1 = entry_inside_1.model_copy(
-        update={"id": str(uuid.uuid4()), "log_date": date(2024, 5, 20)}
-    )
-    entry_inside_2 = create_test_entry(tenant_id)
-    entry_inside_2 = entry_inside_2.model_copy(
-        update={"id": str(uuid.uuid4()), "log_date": date(2024, 5, 22)}
-    )
-    entry_outside = create_test_entry(tenant_id)
-    entry_outside = entry_outside.model_copy(
-        update={"id": str(uuid.uuid4()), "log_date": date(2024, 5, 25)}
-    )
+    entry_inside_1 = create_test_entry(tenant_id, log_date=date(2024, 5, 20))
+    entry_inside_2 = create_test_entry(tenant_id, log_date=date(2024, 5, 22))
+    entry_outside = create_test_entry(tenant_id, log_date=date(2024, 5, 25))
 
-    await sqlite_repo.save(entry_inside_1)
-    await sqlite_repo.save(entry_inside_2)
-    await sqlite_repo.save(entry_outside)
+    await sqlite_repo.save_many([entry_inside_1, entry_inside_2, entry_outside])
 
     results = await sqlite_repo.find_by_date_range(tenant_id, date(2024, 5, 20), date(2024, 5, 23))
     result_ids = {e.id for e in results}
@@ -141,20 +146,24 @@ async def test_find_by_date_range(sqlite_repo):
     assert entry_outside.id not in result_ids
 
 
-@pytest.mark.asyncio
 async def test_find_by_date_range_tenant_isolation(sqlite_repo):
-    entry_alice = create_test_entry("alice")
-    entry_alice = entry_alice.model_copy(
-        update={"id": str(uuid.uuid4()), "log_date": date(2024, 5, 20)}
-    )
-    entry_bob = create_test_entry("bob")
-    entry_bob = entry_bob.model_copy(
-        update={"id": str(uuid.uuid4()), "log_date": date(2024, 5, 20)}
-    )
+    entry_alice = create_test_entry("alice", log_date=date(2024, 5, 20))
+    entry_bob = create_test_entry("bob", log_date=date(2024, 5, 20))
 
-    await sqlite_repo.save(entry_alice)
-    await sqlite_repo.save(entry_bob)
+    await sqlite_repo.save_many([entry_alice, entry_bob])
 
     results = await sqlite_repo.find_by_date_range("alice", date(2024, 5, 19), date(2024, 5, 21))
     assert len(results) == 1
     assert results[0].tenant_id == "alice"
+
+
+async def test_file_database_uses_wal(tmp_path):
+    repo = SQLiteLogRepository(f"sqlite+aiosqlite:///{tmp_path / 'wal.db'}")
+    try:
+        async with repo.engine.connect() as conn:
+            journal_mode = (await conn.exec_driver_sql("PRAGMA journal_mode")).scalar()
+            synchronous = (await conn.exec_driver_sql("PRAGMA synchronous")).scalar()
+    finally:
+        await repo.engine.dispose()
+    assert journal_mode == "wal"
+    assert synchronous == 1  # NORMAL
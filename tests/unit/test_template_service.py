@@ -1,5 +1,6 @@
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, call
 
 import pytest
 
@@ -8,12 +9,38 @@ from app.repositories.template_repository import TemplateRepository
 from app.services.log_service import LogService
 from app.services.template_service import TemplateService
 
+_D50 = Decimal(50)
+_D100 = Decimal(100)
+_D150 = Decimal(150)
 
-@pytest.fixture
-def template_repo():
+
+class _HasFields:
+    """Mock argument matcher comparing only the given attributes of the actual argument."""
+
+    def __init__(self, **fields: Any) -> None:
+        self._fields = fields
+
+    def __eq__(self, other: object) -> bool:
+        missing = object()
+        return all(getattr(other, k, missing) == v for k, v in self._fields.items())
+
+    def __repr__(self) -> str:
+        args = ", ".join(f"{k}={v!r}" for k, v in self._fields.items())
+        return f"_HasFields({args})"
+
+
+@pytest.fixture(scope="module")
+def _module_template_repo():
     return TemplateRepository()
 
 
+@pytest.fixture
+def template_repo(_module_template_repo):
+    # Same repository for the whole module, emptied before each test
+    _module_template_repo.clear()
+    return _module_template_repo
+
+
 @pytest.fixture
 def log_service():
     return MagicMock(spec=LogService)
@@ -24,18 +51,13 @@ def template_service(template_repo, log_service):
     return TemplateService(repository=template_repo, log_service=log_service)
 
 
-@pytest.mark.asyncio
 async def test_create_and_get_templates(template_service):
     tenant_id = "tenant_alice"
     payload = MealTemplateCreate(
         name="Healthy Breakfast",
         entries=[
-            MealTemplateEntry(
-                product_id="apple", source=DataSource.MANUAL, quantity_g=Decimal("150")
-            ),
-            MealTemplateEntry(
-                product_id="oats", source=DataSource.MANUAL, quantity_g=Decimal("50")
-            ),
+            MealTemplateEntry(product_id="apple", source=DataSource.MANUAL, quantity_g=_D150),
+            MealTemplateEntry(product_id="oats", source=DataSource.MANUAL, quantity_g=_D50),
         ],
     )
 
@@ -48,15 +70,10 @@ async def test_create_and_get_templates(template_service):
     assert all_templates[0].id == template.id
 
 
-@pytest.mark.asyncio
 async def test_tenant_isolation(template_service):
     alice_payload = MealTemplateCreate(
         name="Alice Meal",
-        entries=[
-            MealTemplateEntry(
-                product_id="apple", source=DataSource.MANUAL, quantity_g=Decimal("100")
-            )
-        ],
+        entries=[MealTemplateEntry(product_id="apple", source=DataSource.MANUAL, quantity_g=_D100)],
     )
     await template_service.create("tenant_alice", alice_payload)
 
@@ -64,16 +81,11 @@ async def test_tenant_isolation(template_service):
     assert len(bob_templates) == 0
 
 
-@pytest.mark.asyncio
 async def test_delete_template(template_service):
     tenant_id = "tenant_alice"
     payload = MealTemplateCreate(
         name="To Delete",
-        entries=[
-            MealTemplateEntry(
-                product_id="apple", source=DataSource.MANUAL, quantity_g=Decimal("100")
-            )
-        ],
+        entries=[MealTemplateEntry(product_id="apple", source=DataSource.MANUAL, quantity_g=_D100)],
     )
     template = await template_service.create(tenant_id, payload)
 
@@ -84,7 +96,6 @@ async def test_delete_template(template_service):
     assert len(all_templates) == 0
 
 
-@pytest.mark.asyncio
 async def test_log_template(template_service, log_service):
     tenant_id = "tenant_alice"
     payload = MealTemplateCreate(
@@ -93,12 +104,10 @@ async def test_log_template(template_service, log_service):
             MealTemplateEntry(
                 product_id="apple",
                 source=DataSource.MANUAL,
-                quantity_g=Decimal("150"),
+                quantity_g=_D150,
                 note="Yummy",
             ),
-            MealTemplateEntry(
-                product_id="oats", source=DataSource.MANUAL, quantity_g=Decimal("50")
-            ),
+            MealTemplateEntry(product_id="oats", source=DataSource.MANUAL, quantity_g=_D50),
         ],
     )
     template = await template_service.create(tenant_id, payload)
@@ -108,14 +117,13 @@ async def test_log_template(template_service, log_service):
 
     await template_service.log_template(tenant_id, template.id)
 
-    assert log_service.create_entry.call_count == 2
-    # Check calls
-    calls = log_service.create_entry.call_args_list
-    assert calls[0].args[0] == tenant_id
-    assert calls[0].args[1].product_id == "apple"
-    assert calls[0].args[1].quantity_g == Decimal("150")
-    assert calls[0].args[1].note == "Yummy"
-
-    assert calls[1].args[0] == tenant_id
-    assert calls[1].args[1].product_id == "oats"
-    assert calls[1].args[1].quantity_g == Decimal("50")
+    assert log_service.create_entry.await_count == 2
+    log_service.create_entry.assert_has_awaits(
+        [
+            call(
+                tenant_id,
+                _HasFields(product_id="apple", quantity_g=_D150, note="Yummy"),
+            ),
+            call(tenant_id, _HasFields(product_id="oats", quantity_g=_D50)),
+        ]
+    )